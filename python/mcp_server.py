@@ -20,13 +20,15 @@ def setup_python_path():
     src_path = project_root / "src"
 
     if src_path.exists():
-        sys.path.insert(0, str(src_path))
+        if str(src_path) not in sys.path:
+            sys.path.insert(0, str(src_path))
         return True
 
     # 如果在開發環境中，src 可能在不同位置
     alt_src_path = project_root.parent / "src"
     if alt_src_path.exists():
-        sys.path.insert(0, str(alt_src_path))
+        if str(alt_src_path) not in sys.path:
+            sys.path.insert(0, str(alt_src_path))
         return True
 
     return False
@@ -51,8 +53,8 @@ async def main():
         # 創建 MCP 伺服器
         server = await create_mcp_server(settings)
 
-        # 啟動伺服器 (使用 stdio transport)
-        server.run(transport="stdio")
+        # 啟動伺服器 (使用 stdio transport，與 gRPC 橋接器共用事件迴圈)
+        await server.run_async(transport="stdio")
 
     except ImportError as e:
         print(f"Import error: {e}", file=sys.stderr)
@@ -69,13 +71,20 @@ async def main():
 
 
 if __name__ == "__main__":
-    # 設置事件循環策略 (Windows 兼容性)
+    # 設置事件循環 (Windows 兼容性；其他平台交由 run_event_loop 選用 uvloop)
+    run = asyncio.run
     if sys.platform.startswith("win"):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    elif setup_python_path():
+        try:
+            from mnemosyne.mcp_adapter.server import run_event_loop as run
+        except ImportError:
+            # 缺少依賴時由 main() 回報錯誤
+            pass
 
     # 運行主程式
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\nServer stopped by user", file=sys.stderr)
         sys.exit(0)
@@ -8,9 +8,34 @@ __version__ = "0.1.0"
 __author__ = "Mnemosyne Team"
 __description__ = "主動的、有狀態的軟體知識圖譜引擎"
 
-from . import ecl
-from .api.main import app
-from .core.config import get_settings
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import ecl
+    from .api.main import app
+    from .core.config import get_settings
+
+# 延遲載入的公開屬性，匯入任一子模組時不必連帶載入 FastAPI 應用與 ECL 管線
+_LAZY_ATTRS = {
+    "ecl": (".ecl", None),
+    "app": (".api.main", "app"),
+    "get_settings": (".core.config", "get_settings"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """首次存取時才載入對應模組"""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
@@ -4,6 +4,7 @@ FastAPI 主應用
 這是 Mnemosyne MCP 的 REST API 入口點，提供 HTTP/JSON 接口。
 """
 
+import os
 import time
 from contextlib import asynccontextmanager
 from typing import Any, Dict
@@ -54,6 +55,11 @@ async def lifespan(app: FastAPI):
         logger.error("Configuration validation failed", errors=config_errors)
         raise RuntimeError(f"Configuration errors: {config_errors}")
 
+    # 模型的驗證器已在匯入時建好；OpenAPI schema 則預設延遲到首個 /docs 請求才產生，
+    # 在啟動時先建好以免首個請求承擔成本（MNEMOSYNE_EAGER_SCHEMA=0 可關閉）
+    if os.getenv("MNEMOSYNE_EAGER_SCHEMA", "1") != "0":
+        app.openapi()
+
     # 初始化圖資料庫客戶端
     try:
         db_config = settings.database.to_connection_config()
@@ -5,13 +5,23 @@
 """
 
 import asyncio
+import atexit
 import json
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 import click
 
+# orjson 為可選依賴（pip install mnemosyne-mcp[speedups]）
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 from ..governance.constraint_engine import ConstraintEngine
 from ..governance.models import (
     Constraint,
@@ -25,6 +35,11 @@ from ..governance.models import (
 class OutputFormatter:
     """輸出格式化器"""
 
+    # 嚴重程度對應的圖示
+    SEVERITY_EMOJI = MappingProxyType(
+        {Severity.ERROR: "❌", Severity.WARNING: "⚠️", Severity.INFO: "ℹ️"}
+    )
+
     def __init__(self, format_type: str = "human"):
         self.format_type = format_type
 
@@ -42,21 +57,17 @@ class OutputFormatter:
         lines.append("🔍 程式碼檢查結果")
         lines.append("=" * 50)
 
-        if result.violations:
-            for violation in result.violations:
-                severity_emoji = {
-                    Severity.ERROR: "❌",
-                    Severity.WARNING: "⚠️",
-                    Severity.INFO: "ℹ️",
-                }.get(violation.severity, "")
-
-                lines.append(
-                    f"{severity_emoji} {violation.location.file_path}:{violation.location.line_number}"
-                )
-                lines.append(f"   {violation.message}")
-                if violation.suggestion:
-                    lines.append(f"   💡 建議: {violation.suggestion}")
-                lines.append("")
+        severity_emoji = self.SEVERITY_EMOJI
+        for violation in result.violations:
+            location = violation.location
+            lines.append(
+                f"{severity_emoji.get(violation.severity, '')} "
+                f"{location.file_path}:{location.line_number}"
+            )
+            lines.append(f"   {violation.message}")
+            if violation.suggestion:
+                lines.append(f"   💡 建議: {violation.suggestion}")
+            lines.append("")
 
         # 摘要
         lines.append("📊 檢查摘要")
@@ -101,9 +112,33 @@ class OutputFormatter:
             ],
         }
 
+        # 若已安裝 orjson 則使用較快的編碼器；輸出為等價的 JSON，
+        # 但浮點數格式等細節可能與 json.dumps 不同。orjson 不支援超過 64 位元的整數，
+        # 此處的整數皆為計數與行號，不會超過該範圍
+        if _HAS_ORJSON:
+            return orjson.dumps(result_dict, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(result_dict, indent=2, ensure_ascii=False)
 
 
+# 同一行程內重複執行 pr-check 時共用的事件迴圈（首次使用時建立）
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """取得共用的事件迴圈"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+@atexit.register
+def _close_loop() -> None:
+    """行程結束時關閉共用的事件迴圈"""
+    if _loop is not None and not _loop.is_closed():
+        _loop.close()
+
+
 class GovernanceCLI:
     """治理 CLI 主類"""
 
@@ -115,17 +150,17 @@ class GovernanceCLI:
         """設置 CLI 環境"""
         # 載入配置
         if config_path and Path(config_path).exists():
-            await self._load_config(config_path)
+            self._load_config(config_path)
         else:
             # 載入默認約束
-            await self._load_default_constraints()
+            self._load_default_constraints()
 
-    async def _load_config(self, config_path: str):
+    def _load_config(self, config_path: str):
         """載入約束配置"""
         # 簡化實作，實際會解析 YAML 配置
         pass
 
-    async def _load_default_constraints(self):
+    def _load_default_constraints(self):
         """載入默認約束"""
 
         # 添加默認的架構約束
@@ -167,37 +202,22 @@ class GovernanceCLI:
             await self.setup(config_path)
 
             # 2. 獲取變更的檔案（模擬）
-            changed_files = await self._get_changed_files(target_branch)
+            changed_files = self._get_changed_files(target_branch)
 
             # 3. 解析 AST 數據（模擬）
-            files_data = {}
-            for file_path in changed_files:
-                ast_data = await self._parse_file_ast(file_path)
-                files_data[file_path] = ast_data
-
-            # 4. 執行約束檢查
-            all_violations = []
-            total_files = len(files_data)
-
-            for file_path, ast_data in files_data.items():
-                result = await self.constraint_engine.validate_file(file_path, ast_data)
-                all_violations.extend(result.violations)
-
-            # 5. 創建總結果
-            final_result = ValidationResult(
-                success=True, total_files_checked=total_files
-            )
-
-            for violation in all_violations:
-                final_result.add_violation(violation)
+            files_data = {
+                file_path: self._parse_file_ast(file_path)
+                for file_path in changed_files
+            }
 
-            final_result.success = not final_result.has_errors()
+            # 4. 批次執行約束檢查，直接得到總結果
+            final_result = await self.constraint_engine.validate_files(files_data)
 
-            # 6. 輸出結果
+            # 5. 輸出結果
             output = self.formatter.format_validation_result(final_result)
             click.echo(output)
 
-            # 7. 設置退出碼
+            # 6. 設置退出碼
             if severity_threshold == "error" and final_result.has_errors():
                 return 1
             elif severity_threshold == "warning" and (
@@ -211,15 +231,42 @@ class GovernanceCLI:
             click.echo(f"錯誤: {e}", err=True)
             return 1
 
-    async def _get_changed_files(self, target_branch: str) -> List[str]:
-        """獲取變更的檔案列表（模擬實作）"""
+    def run_sync(
+        self,
+        target_branch: str = "main",
+        config_path: Optional[str] = None,
+        format_type: str = "human",
+        severity_threshold: str = "error",
+    ) -> int:
+        """
+        同步執行 PR 檢查
+
+        參數同 pr_check；重複呼叫時共用同一個事件迴圈，
+        省去每次建立與關閉迴圈的成本。
+        """
+        return _get_loop().run_until_complete(
+            self.pr_check(
+                target_branch=target_branch,
+                config_path=config_path,
+                format_type=format_type,
+                severity_threshold=severity_threshold,
+            )
+        )
+
+    def _get_changed_files(self, target_branch: str) -> List[str]:
+        """
+        獲取變更的檔案列表（模擬實作）
+
+        模擬資料不涉及 I/O，因此為同步方法；改為實際呼叫 git 時應透過
+        asyncio.to_thread 執行，避免阻塞事件迴圈。
+        """
         return [
             "src/ui/components/user_form.py",
             "src/services/user_service.py",
             "src/data/user_repository.py",
         ]
 
-    async def _parse_file_ast(self, file_path: str) -> Dict:
+    def _parse_file_ast(self, file_path: str) -> Dict:
         """解析檔案的 AST 數據（模擬實作）"""
         # 模擬不同檔案的 AST 數據
         if "ui" in file_path:
@@ -267,14 +314,11 @@ def pr_check_command(
     """檢查 PR 中的程式碼約束違規"""
     cli = GovernanceCLI()
 
-    # 運行異步檢查
-    exit_code = asyncio.run(
-        cli.pr_check(
-            target_branch=target_branch,
-            config_path=config_path,
-            format_type=format_type,
-            severity_threshold=severity_threshold,
-        )
+    exit_code = cli.run_sync(
+        target_branch=target_branch,
+        config_path=config_path,
+        format_type=format_type,
+        severity_threshold=severity_threshold,
     )
 
     sys.exit(exit_code)
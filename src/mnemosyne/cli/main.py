@@ -334,11 +334,13 @@ def serve_mcp(ctx, transport: str, debug: bool):
             click.echo("", err=True)
             click.echo("✅ MCP 伺服器準備就緒，等待客戶端連線...", err=True)
 
-            # 啟動伺服器 (將阻塞在此處)
-            server.run(transport=transport)
+            # 在同一事件迴圈上啟動伺服器 (將阻塞在此處)
+            await server.run_async(transport=transport)
 
-        # 執行 MCP 伺服器
-        asyncio.run(run_mcp_server())
+        # 執行 MCP 伺服器 (可用時使用 uvloop 事件迴圈)
+        from ..mcp_adapter.server import run_event_loop
+
+        run_event_loop(run_mcp_server())
 
     except KeyboardInterrupt:
         click.echo("\n👋 MCP 伺服器已停止", err=True)
@@ -682,13 +684,11 @@ def pr_check_command(
         from .governance import GovernanceCLI
 
         cli_instance = GovernanceCLI()
-        exit_code = asyncio.run(
-            cli_instance.pr_check(
-                target_branch=target_branch,
-                config_path=config_path,
-                format_type=format_type,
-                severity_threshold=severity_threshold,
-            )
+        exit_code = cli_instance.run_sync(
+            target_branch=target_branch,
+            config_path=config_path,
+            format_type=format_type,
+            severity_threshold=severity_threshold,
         )
 
         if exit_code != 0:
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 import structlog
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from ..core.config import MCPAtlassianSettings
 
@@ -52,6 +52,8 @@ class JiraIssue(BaseModel):
     updated: Optional[str] = Field(default=None, description="更新時間")
     labels: List[str] = Field(default_factory=list, description="標籤")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ConfluencePage(BaseModel):
     """Confluence 頁面數據模型"""
@@ -66,6 +68,13 @@ class ConfluencePage(BaseModel):
     version: Optional[int] = Field(default=None, description="版本號")
     url: Optional[str] = Field(default=None, description="頁面 URL")
 
+    model_config = ConfigDict(frozen=True)
+
+
+# 以單次 pydantic-core 呼叫驗證整個回應列表
+_JIRA_ISSUE_LIST_ADAPTER = TypeAdapter(List[JiraIssue])
+_CONFLUENCE_PAGE_LIST_ADAPTER = TypeAdapter(List[ConfluencePage])
+
 
 class AtlassianClient:
     """
@@ -265,18 +274,23 @@ class AtlassianClient:
             return []
 
         try:
-            issues = []
-            for issue_data in response.data.get("issues", []):
-                try:
-                    issue = JiraIssue(**issue_data)
-                    issues.append(issue)
-                except ValidationError as e:
-                    logger.warning(
-                        "Failed to parse Jira issue",
-                        issue_data=issue_data,
-                        error=str(e),
-                    )
-                    continue
+            raw_issues = response.data.get("issues", [])
+            try:
+                issues = _JIRA_ISSUE_LIST_ADAPTER.validate_python(raw_issues)
+            except ValidationError:
+                # 含無效項目時逐筆驗證，略過無法解析的 Issue
+                issues = []
+                for issue_data in raw_issues:
+                    try:
+                        issue = JiraIssue(**issue_data)
+                        issues.append(issue)
+                    except ValidationError as e:
+                        logger.warning(
+                            "Failed to parse Jira issue",
+                            issue_data=issue_data,
+                            error=str(e),
+                        )
+                        continue
 
             logger.info(
                 "Jira search completed",
@@ -381,18 +395,23 @@ class AtlassianClient:
             return []
 
         try:
-            pages = []
-            for page_data in response.data.get("pages", []):
-                try:
-                    page = ConfluencePage(**page_data)
-                    pages.append(page)
-                except ValidationError as e:
-                    logger.warning(
-                        "Failed to parse Confluence page",
-                        page_data=page_data,
-                        error=str(e),
-                    )
-                    continue
+            raw_pages = response.data.get("pages", [])
+            try:
+                pages = _CONFLUENCE_PAGE_LIST_ADAPTER.validate_python(raw_pages)
+            except ValidationError:
+                # 含無效項目時逐筆驗證，略過無法解析的頁面
+                pages = []
+                for page_data in raw_pages:
+                    try:
+                        page = ConfluencePage(**page_data)
+                        pages.append(page)
+                    except ValidationError as e:
+                        logger.warning(
+                            "Failed to parse Confluence page",
+                            page_data=page_data,
+                            error=str(e),
+                        )
+                        continue
 
             logger.info(
                 "Confluence search completed",
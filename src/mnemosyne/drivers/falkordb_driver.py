@@ -4,6 +4,7 @@ FalkorDB 驅動實作
 這個模組實作了 FalkorDB 的 GraphStoreClient 驅動。
 """
 
+import string
 import time
 import uuid
 from typing import Any, Dict, List, Optional
@@ -21,6 +22,14 @@ from ..interfaces.graph_store import (
 
 logger = structlog.get_logger(__name__)
 
+# 可直接嵌入 Cypher 程序呼叫的標籤與屬性名稱字元
+_IDENTIFIER_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def _is_valid_identifier(name: str) -> bool:
+    """檢查標籤或屬性名稱是否只包含英數字、底線與連字號"""
+    return bool(name) and _IDENTIFIER_CHARS.issuperset(name)
+
 
 class FalkorDBDriver(GraphStoreClient):
     """
@@ -150,17 +159,20 @@ class FalkorDBDriver(GraphStoreClient):
 
     async def ping(self) -> bool:
         """檢查 FalkorDB 連接狀態"""
+        result = await self.probe()
+        return result is not None and not result.is_empty
+
+    async def probe(self) -> Optional[QueryResult]:
+        """以單一測試查詢檢查 FalkorDB 連接狀態"""
         try:
             if not self._client or not self._graph:
-                return False
+                return None
 
-            # 執行簡單的 ping 查詢
-            result = await self.execute_query("RETURN 1")
-            return not result.is_empty
+            return await self.execute_query("RETURN 1 as test")
 
         except Exception as e:
             self.logger.debug("Ping failed", error=str(e))
-            return False
+            return None
 
     def _test_connection(self) -> None:
         """測試連接是否正常"""
@@ -270,6 +282,11 @@ class FalkorDBDriver(GraphStoreClient):
             bool: 是否成功創建索引
         """
         try:
+            # 標籤與屬性名稱會直接嵌入查詢，先確認不含特殊字元
+            for identifier in (node_label, property_name):
+                if not _is_valid_identifier(identifier):
+                    raise ValueError(f"無效的標籤或屬性名稱: {identifier!r}")
+
             # 構建創建向量索引的 Cypher 查詢
             query = f"""
             CALL db.idx.vector.createNodeIndex(
@@ -327,6 +344,11 @@ class FalkorDBDriver(GraphStoreClient):
             List[Dict[str, Any]]: 搜索結果列表
         """
         try:
+            # 標籤與屬性名稱會直接嵌入查詢，先確認不含特殊字元
+            for identifier in (node_label, property_name):
+                if not _is_valid_identifier(identifier):
+                    raise ValueError(f"無效的標籤或屬性名稱: {identifier!r}")
+
             # 構建向量搜索的 Cypher 查詢
             query = f"""
             CALL db.idx.vector.queryNodes(
@@ -4,16 +4,17 @@
 基於規則引擎模式實作的約束檢查系統，支援多種約束類型和可擴展的規則定義。
 """
 
-import asyncio
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
 import structlog
 
 from .models import (
     Constraint,
     ConstraintType,
+    Severity,
     ValidationResult,
     Violation,
     ViolationLocation,
@@ -30,7 +31,7 @@ class Rule(ABC):
         self.rule_config = constraint.rule_config
 
     @abstractmethod
-    async def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
+    def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
         """檢查規則違規"""
         pass
 
@@ -55,18 +56,21 @@ class Rule(ABC):
 class ArchitectureRule(Rule):
     """架構約束規則"""
 
-    async def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
+    def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
         """檢查架構約束違規"""
         violations = []
 
+        # 示例：檢查是否違反分層架構，只有 UI 層檔案需要檢查其匯入
+        if "ui" not in file_path.lower():
+            return violations
+
         # 簡化的架構檢查邏輯
         imports = ast_data.get("imports", [])
 
         for import_info in imports:
             module_name = import_info.get("module", "")
 
-            # 示例：檢查是否違反分層架構
-            if "ui" in file_path.lower() and "database" in module_name.lower():
+            if "database" in module_name.lower():
                 violation = self.create_violation(
                     message=f"架構違規: UI 層不應直接訪問數據層 {module_name}",
                     location=ViolationLocation(
@@ -83,13 +87,23 @@ class ArchitectureRule(Rule):
 class SecurityRule(Rule):
     """安全約束規則"""
 
-    async def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
+    # 預設的危險函數名稱
+    DANGEROUS_FUNCTIONS: ClassVar[FrozenSet[str]] = frozenset(
+        {"eval", "exec", "compile"}
+    )
+
+    def check(self, file_path: str, ast_data: Dict) -> List[Violation]:
         """檢查安全約束違規"""
         violations = []
 
+        # 規則配置可透過 dangerous_functions 追加名稱；配置可被修改，每次檢查時讀取
+        extra = getattr(self.rule_config, "dangerous_functions", None)
+        dangerous_functions = (
+            self.DANGEROUS_FUNCTIONS.union(extra) if extra else self.DANGEROUS_FUNCTIONS
+        )
+
         # 檢查危險函數調用
         function_calls = ast_data.get("function_calls", [])
-        dangerous_functions = ["eval", "exec", "compile"]
 
         for call in function_calls:
             function_name = call.get("name", "")
@@ -131,46 +145,71 @@ class ConstraintEngine:
     def __init__(self):
         self.rule_registry = RuleRegistry()
         self.constraints: Dict[str, Constraint] = {}
+        # 依約束 ID 快取規則實例與建立時的約束內容，跨檔案檢查時重複使用
+        self._rule_cache: Dict[str, Tuple[Dict[str, Any], Rule]] = {}
 
     def add_constraint(self, constraint: Constraint) -> None:
         """添加約束"""
         self.constraints[constraint.id] = constraint
+        self._rule_cache.pop(constraint.id, None)
+
+    def _get_rule(self, constraint: Constraint) -> Rule:
+        """取得約束對應的規則實例，首次使用或約束內容變更時建立"""
+        # 約束及其 rule_config 可被原地修改，比對內容快照判斷快取是否仍有效
+        snapshot = constraint.model_dump()
+        cached = self._rule_cache.get(constraint.id)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        rule = self.rule_registry.create_rule(constraint)
+        self._rule_cache[constraint.id] = (snapshot, rule)
+        return rule
 
     def list_constraints(self) -> List[Constraint]:
         """列出啟用的約束"""
         return [c for c in self.constraints.values() if c.enabled]
 
-    async def validate_file(self, file_path: str, ast_data: Dict) -> ValidationResult:
-        """驗證單個檔案"""
-        start_time = time.time()
-        result = ValidationResult(success=True, total_files_checked=1)
-
-        # 獲取啟用的約束
-        active_constraints = self.list_constraints()
-
-        # 並行執行所有規則檢查
-        tasks = []
-        for constraint in active_constraints:
+    def _active_rules(self) -> List[Rule]:
+        """取得所有啟用約束的規則實例，無法建立的規則記錄後略過"""
+        rules = []
+        for constraint in self.list_constraints():
             try:
-                rule = self.rule_registry.create_rule(constraint)
-                task = rule.check(file_path, ast_data)
-                tasks.append(task)
+                rules.append(self._get_rule(constraint))
             except Exception as e:
                 logger.warning(f"無法創建規則 {constraint.id}: {e}")
+        return rules
 
-        # 等待所有檢查完成
-        if tasks:
-            violations_lists = await asyncio.gather(*tasks, return_exceptions=True)
+    async def validate_file(self, file_path: str, ast_data: Dict) -> ValidationResult:
+        """驗證單個檔案"""
+        return await self.validate_files({file_path: ast_data})
+
+    async def validate_files(self, files: Dict[str, Dict]) -> ValidationResult:
+        """
+        批次驗證多個檔案
 
-            for result_or_exc in violations_lists:
-                if isinstance(result_or_exc, Exception):
-                    logger.warning(f"規則檢查失敗: {result_or_exc}")
-                    continue
+        所有檔案共用同一組規則與單一結果，違規統計在最後一次計算。
 
-                for violation in result_or_exc:
-                    result.add_violation(violation)
+        Args:
+            files: 檔案路徑到 AST 數據的映射
+        """
+        start_time = time.time()
+        result = ValidationResult(success=True, total_files_checked=len(files))
+        violations = result.violations
+
+        # 規則檢查皆為純計算，直接依序執行，不建立額外的 Task
+        rules = self._active_rules()
+        for file_path, ast_data in files.items():
+            for rule in rules:
+                try:
+                    violations.extend(rule.check(file_path, ast_data))
+                except Exception as e:
+                    logger.warning(f"規則檢查失敗: {e}")
 
         # 設置結果狀態
+        severity_counts = Counter(v.severity for v in violations)
+        result.total_violations = len(violations)
+        result.error_count = severity_counts[Severity.ERROR]
+        result.warning_count = severity_counts[Severity.WARNING]
         result.success = not result.has_errors()
         result.execution_time_ms = (time.time() - start_time) * 1000
 
@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ConstraintType(str, Enum):
@@ -31,8 +31,7 @@ class Severity(str, Enum):
 class RuleConfig(BaseModel):
     """規則配置基類"""
 
-    class Config:
-        extra = "allow"  # 允許額外字段以支援不同規則類型
+    model_config = ConfigDict(extra="allow")  # 允許額外字段以支援不同規則類型
 
 
 class Constraint(BaseModel):
@@ -65,6 +64,8 @@ class ViolationLocation(BaseModel):
     function_name: Optional[str] = Field(None, description="函數名稱")
     class_name: Optional[str] = Field(None, description="類名稱")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Violation(BaseModel):
     """約束違規"""
@@ -84,6 +85,8 @@ class Violation(BaseModel):
     # 元數據
     detected_at: datetime = Field(default_factory=datetime.utcnow, description="檢測時間")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ValidationResult(BaseModel):
     """驗證結果"""
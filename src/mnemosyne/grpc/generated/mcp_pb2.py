@@ -4,6 +4,7 @@
 # source: mcp.proto
 # Protobuf Python Version: 6.31.0
 """Generated protocol buffer code."""
+
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import runtime_version as _runtime_version
@@ -18,6 +19,9 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
     b'\n\tmcp.proto\x12\x10mnemosyne.mcp.v1\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto"\x14\n\x12HealthCheckRequest"\xc8\x01\n\x13HealthCheckResponse\x12<\n\x06status\x18\x01 \x01(\x0e\x32,.mnemosyne.mcp.v1.HealthCheckResponse.Status\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\ttimestamp\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp"3\n\x06Status\x12\x0b\n\x07SERVING\x10\x00\x12\x0f\n\x0bNOT_SERVING\x10\x01\x12\x0b\n\x07UNKNOWN\x10\x02"[\n\x14IngestProjectRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x0f\n\x07git_url\x18\x02 \x01(\t\x12\x13\n\x06\x62ranch\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\t\n\x07_branch"(\n\x15IngestProjectResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\xdb\x01\n\x0cIngestStatus\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x35\n\x06status\x18\x02 \x01(\x0e\x32%.mnemosyne.mcp.v1.IngestStatus.Status\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x33\n\x0f\x63ompletion_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp"=\n\x06Status\x12\x0b\n\x07PENDING\x10\x00\x12\x0b\n\x07RUNNING\x10\x01\x12\r\n\tCOMPLETED\x10\x02\x12\n\n\x06\x46\x41ILED\x10\x03")\n\x16GetIngestStatusRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"v\n\rSearchRequest\x12\x12\n\nquery_text\x18\x01 \x01(\t\x12\r\n\x05top_k\x18\x02 \x01(\x05\x12\x33\n\nas_of_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\r\n\x0b_as_of_time"\xa1\x01\n\x0eSearchResponse\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x36\n\x0erelevant_nodes\x18\x02 \x03(\x0b\x32\x1e.mnemosyne.mcp.v1.SearchResult\x12)\n\x08subgraph\x18\x03 \x01(\x0b\x32\x17.mnemosyne.mcp.v1.Graph\x12\x1b\n\x13suggested_next_step\x18\x04 \x01(\t"\xe4\x01\n\x0cSearchResult\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x11\n\tnode_type\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x18\n\x10similarity_score\x18\x04 \x01(\x02\x12\x42\n\nproperties\x18\x05 \x03(\x0b\x32..mnemosyne.mcp.v1.SearchResult.PropertiesEntry\x12\x0e\n\x06labels\x18\x06 \x03(\t\x1a\x31\n\x0fPropertiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01">\n\x15ImpactAnalysisRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x11\n\tpr_number\x18\x02 \x01(\t"\xcf\x01\n\x16ImpactAnalysisResponse\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x46\n\nrisk_level\x18\x02 \x01(\x0e\x32\x32.mnemosyne.mcp.v1.ImpactAnalysisResponse.RiskLevel\x12\x30\n\x0fimpact_subgraph\x18\x03 \x01(\x0b\x32\x17.mnemosyne.mcp.v1.Graph"*\n\tRiskLevel\x12\x07\n\x03LOW\x10\x00\x12\n\n\x06MEDIUM\x10\x01\x12\x08\n\x04HIGH\x10\x02"R\n\x12\x41\x63quireLockRequest\x12\x19\n\x11target_node_query\x18\x01 \x01(\t\x12\x10\n\x08\x61gent_id\x18\x02 \x01(\t\x12\x0f\n\x07task_id\x18\x03 \x01(\t"y\n\x13\x41\x63quireLockResponse\x12\x0e\n\x06locked\x18\x01 \x01(\x08\x12=\n\x10\x63onflict_details\x18\x02 \x01(\x0b\x32\x1e.mnemosyne.mcp.v1.LockConflictH\x00\x88\x01\x01\x42\x13\n\x11_conflict_details"%\n\x12ReleaseLockRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\'\n\x13ReleaseLockResponse\x12\x10\n\x08released\x18\x01 \x01(\x08"M\n\x16\x41pplyConstraintRequest\x12\x1d\n\x15\x63onstraint_definition\x18\x01 \x01(\t\x12\x14\n\x0ctarget_query\x18\x02 \x01(\t"A\n\x17\x41pplyConstraintResponse\x12\x15\n\rconstraint_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61pplied\x18\x02 \x01(\x08"{\n\x0cLockConflict\x12\x1c\n\x14\x63onflicting_agent_id\x18\x01 \x01(\t\x12\x1b\n\x13\x63onflicting_task_id\x18\x02 \x01(\t\x12\x30\n\x0clocked_since\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp"\x86\x01\n\x1cGetGraphVisualizationRequest\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x1a\n\rfocus_node_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tmax_depth\x18\x03 \x01(\x05H\x01\x88\x01\x01\x42\x10\n\x0e_focus_node_idB\x0c\n\n_max_depth"Q\n\x12GraphVisualization\x12&\n\x05graph\x18\x01 \x01(\x0b\x32\x17.mnemosyne.mcp.v1.Graph\x12\x13\n\x0blayout_data\x18\x02 \x01(\t"]\n\x04Node\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12+\n\nproperties\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x0e\n\x06labels\x18\x04 \x03(\t"\x8a\x01\n\x04\x45\x64ge\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0esource_node_id\x18\x02 \x01(\t\x12\x16\n\x0etarget_node_id\x18\x03 \x01(\t\x12\x19\n\x11relationship_type\x18\x04 \x01(\t\x12+\n\nproperties\x18\x05 \x01(\x0b\x32\x17.google.protobuf.Struct"\xbf\x01\n\x05Graph\x12%\n\x05nodes\x18\x01 \x03(\x0b\x32\x16.mnemosyne.mcp.v1.Node\x12%\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x16.mnemosyne.mcp.v1.Edge\x12\x37\n\x08metadata\x18\x03 \x03(\x0b\x32%.mnemosyne.mcp.v1.Graph.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xed\x06\n\x0cMnemosyneMCP\x12Z\n\x0bHealthCheck\x12$.mnemosyne.mcp.v1.HealthCheckRequest\x1a%.mnemosyne.mcp.v1.HealthCheckResponse\x12`\n\rIngestProject\x12&.mnemosyne.mcp.v1.IngestProjectRequest\x1a\'.mnemosyne.mcp.v1.IngestProjectResponse\x12[\n\x0fGetIngestStatus\x12(.mnemosyne.mcp.v1.GetIngestStatusRequest\x1a\x1e.mnemosyne.mcp.v1.IngestStatus\x12K\n\x06Search\x12\x1f.mnemosyne.mcp.v1.SearchRequest\x1a .mnemosyne.mcp.v1.SearchResponse\x12\x66\n\x11RunImpactAnalysis\x12\'.mnemosyne.mcp.v1.ImpactAnalysisRequest\x1a(.mnemosyne.mcp.v1.ImpactAnalysisResponse\x12\x66\n\x0f\x41pplyConstraint\x12(.mnemosyne.mcp.v1.ApplyConstraintRequest\x1a).mnemosyne.mcp.v1.ApplyConstraintResponse\x12Z\n\x0b\x41\x63quireLock\x12$.mnemosyne.mcp.v1.AcquireLockRequest\x1a%.mnemosyne.mcp.v1.AcquireLockResponse\x12Z\n\x0bReleaseLock\x12$.mnemosyne.mcp.v1.ReleaseLockRequest\x1a%.mnemosyne.mcp.v1.ReleaseLockResponse\x12m\n\x15GetGraphVisualization\x12..mnemosyne.mcp.v1.GetGraphVisualizationRequest\x1a$.mnemosyne.mcp.v1.GraphVisualizationb\x06proto3'
 )
@@ -5,7 +5,7 @@ GraphStoreClient 抽象介面定義
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -14,9 +14,9 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionConfig:
-    """資料庫連接配置"""
+    """資料庫連接配置（不可變，可作為連線快取的鍵）"""
 
     host: str
     port: int
@@ -26,22 +26,30 @@ class ConnectionConfig:
     connection_pool_size: int = 10
     connection_timeout: int = 30
     query_timeout: int = 60
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "host": self.host,
+                "port": self.port,
+                "database": self.database,
+                "username": self.username,
+                "password": self.password,
+                "connection_pool_size": self.connection_pool_size,
+                "connection_timeout": self.connection_timeout,
+                "query_timeout": self.query_timeout,
+            },
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        """轉換為字典格式"""
-        return {
-            "host": self.host,
-            "port": self.port,
-            "database": self.database,
-            "username": self.username,
-            "password": self.password,
-            "connection_pool_size": self.connection_pool_size,
-            "connection_timeout": self.connection_timeout,
-            "query_timeout": self.query_timeout,
-        }
-
-
-@dataclass
+        """轉換為字典格式（回傳快取字典的淺拷貝）"""
+        return dict(self._dict)
+
+
+@dataclass(slots=True)
 class QueryResult:
     """查詢結果封裝"""
 
@@ -133,6 +141,20 @@ class GraphStoreClient(ABC):
         """
         pass
 
+    async def probe(self) -> Optional[QueryResult]:
+        """
+        以單次往返同時檢查連接狀態與查詢能力
+
+        預設實作先呼叫 ping() 再執行測試查詢；若驅動的 ping() 本身就是查詢，
+        應覆寫此方法以避免重複往返。
+
+        Returns:
+            Optional[QueryResult]: 連接正常時返回測試查詢結果，否則返回 None
+        """
+        if not await self.ping():
+            return None
+        return await self.execute_query("RETURN 1 as test")
+
     async def healthcheck(self) -> Dict[str, Any]:
         """
         執行健康檢查
@@ -142,13 +164,10 @@ class GraphStoreClient(ABC):
         """
         try:
             start_time = datetime.now()
-            is_connected = await self.ping()
+            result = await self.probe()
             response_time = (datetime.now() - start_time).total_seconds() * 1000
 
-            if is_connected:
-                # 執行簡單查詢獲取版本信息
-                result = await self.execute_query("RETURN 1 as test")
-
+            if result is not None:
                 return {
                     "status": "healthy",
                     "connected": True,
@@ -2,13 +2,27 @@
 Mnemosyne MCP - LLM 能力中心
 
 這個模組提供統一的 LLM 能力抽象，支援多種 LLM 提供者。
+提供者實作（如 OpenAIProvider）採延遲載入，只使用 base 型別時不會匯入其依賴。
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base import LLMCapability, LLMProvider
-from .providers.openai_provider import OpenAIProvider
+
+if TYPE_CHECKING:
+    from .providers.openai_provider import OpenAIProvider
 
 __all__ = [
     "LLMProvider",
     "LLMCapability",
     "OpenAIProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """首次存取時才載入提供者實作 (PEP 562)"""
+    if name == "OpenAIProvider":
+        from .providers.openai_provider import OpenAIProvider
+
+        return OpenAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
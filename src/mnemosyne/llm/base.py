@@ -5,10 +5,13 @@ LLM 能力中心基礎抽象
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+
+_EmbeddingT = TypeVar("_EmbeddingT", bound="EmbeddingResponse")
 
 
 class LLMCapability(Enum):
@@ -43,6 +46,33 @@ class EmbeddingResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     usage: Optional[Dict[str, Any]] = None
 
+    _vector: Optional["array[float]"] = PrivateAttr(default=None)
+
+    @property
+    def vector(self) -> "array[float]":
+        """float32 緊湊向量表示，首次存取時建立並快取"""
+        if self._vector is None:
+            self._vector = array("f", self.embedding)
+        return self._vector
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "embedding":
+            self._vector = None
+
+    def __copy__(self: _EmbeddingT) -> _EmbeddingT:
+        # model_copy(update=...) 直接寫入 __dict__，不經過 __setattr__
+        copied = super().__copy__()
+        copied._vector = None
+        return copied
+
+    def __deepcopy__(
+        self: _EmbeddingT, memo: Optional[Dict[int, Any]] = None
+    ) -> _EmbeddingT:
+        copied = super().__deepcopy__(memo)
+        copied._vector = None
+        return copied
+
 
 class LLMProvider(ABC):
     """
@@ -1,11 +1,23 @@
 """
 LLM 提供者模組
 
-包含各種 LLM 提供者的實作。
+包含各種 LLM 提供者的實作。各提供者於首次存取時才載入。
 """
 
-from .openai_provider import OpenAIProvider
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .openai_provider import OpenAIProvider
 
 __all__ = [
     "OpenAIProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """首次存取時才載入提供者實作 (PEP 562)"""
+    if name == "OpenAIProvider":
+        from .openai_provider import OpenAIProvider
+
+        return OpenAIProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
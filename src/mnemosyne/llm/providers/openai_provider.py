@@ -4,7 +4,9 @@ OpenAI 提供者實作
 實作 OpenAI API 的 LLM 能力。
 """
 
+import math
 import os
+import random
 from typing import Any, Dict, List, Optional
 
 import structlog
@@ -13,6 +15,17 @@ from ..base import EmbeddingResponse, LLMCapability, LLMProvider, LLMResponse
 
 logger = structlog.get_logger(__name__)
 
+# 模擬模式使用的亂數產生器
+_MOCK_RNG = random.Random()
+
+
+def _l2_normalize(values: List[float]) -> List[float]:
+    """L2 正規化向量，使餘弦相似度可直接以內積計算"""
+    norm = math.sqrt(math.fsum(v * v for v in values))
+    if norm == 0.0:
+        return values
+    return [v / norm for v in values]
+
 
 class OpenAIProvider(LLMProvider):
     """
@@ -86,9 +99,9 @@ class OpenAIProvider(LLMProvider):
             await self.initialize()
 
         # 模擬實作（用於測試）
-        import random
-
-        embedding = [random.random() for _ in range(1536)]  # text-embedding-3-small 的維度
+        embedding = _l2_normalize(
+            [_MOCK_RNG.random() for _ in range(1536)]  # text-embedding-3-small 的維度
+        )
 
         return EmbeddingResponse(
             embedding=embedding,
@@ -118,7 +118,32 @@ class AtlassianMapper:
     def batch_map_jira_issues(
         issues: List[JiraIssue],
     ) -> Tuple[List[BaseEntity], List[BaseRelationship]]:
-        """批次映射 Jira Issues 到實體和關係"""
+        """
+        批次映射 Jira Issues 到實體和關係
+
+        先以無逐筆例外處理的快速路徑映射整批資料；若任一筆失敗，
+        才退回逐筆映射以記錄並略過有問題的 Issue。
+        """
+        try:
+            entities = [AtlassianMapper.jira_issue_to_entity(i) for i in issues]
+            relationships = [
+                rel
+                for issue, entity in zip(issues, entities)
+                if issue.project
+                and (
+                    rel := AtlassianMapper.create_project_relationship(
+                        entity, issue.project
+                    )
+                )
+            ]
+            return entities, relationships
+        except Exception as e:
+            logger.warning(
+                "Fast batch mapping of Jira issues failed, falling back to per-item",
+                issues_count=len(issues),
+                error=str(e),
+            )
+
         entities = []
         relationships = []
 
@@ -176,7 +201,30 @@ class AtlassianMapper:
     def batch_map_confluence_pages(
         pages: List[ConfluencePage],
     ) -> Tuple[List[BaseEntity], List[BaseRelationship]]:
-        """批次映射 Confluence 頁面到實體和關係"""
+        """
+        批次映射 Confluence 頁面到實體和關係
+
+        與 batch_map_jira_issues 相同：快速路徑失敗時才退回逐筆映射。
+        """
+        try:
+            entities = [AtlassianMapper.confluence_page_to_entity(p) for p in pages]
+            relationships = [
+                rel
+                for page, entity in zip(pages, entities)
+                if page.space
+                and (
+                    rel := AtlassianMapper.create_space_relationship(entity, page.space)
+                )
+            ]
+            return entities, relationships
+        except Exception as e:
+            logger.warning(
+                "Fast batch mapping of Confluence pages failed, falling back to "
+                "per-item",
+                pages_count=len(pages),
+                error=str(e),
+            )
+
         entities = []
         relationships = []
 
@@ -5,16 +5,93 @@ gRPC Bridge for MCP Adapter
 """
 
 import asyncio
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import grpc
 import structlog
 
 from ..core.config import Settings
 from ..grpc.generated import mcp_pb2, mcp_pb2_grpc
+from .utils import TTLCache
 
 logger = structlog.get_logger(__name__)
 
+# gRPC 頻道連線選項（提升連線可靠性與吞吐量）
+_GRPC_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.keepalive_permit_without_calls", True),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+    ("grpc.http2.min_ping_interval_without_data_ms", 300000),
+    # Protobuf 訊息已相當精簡，停用壓縮以省去編解碼成本
+    ("grpc.default_compression_algorithm", 0),
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.optimization_target", "throughput"),
+)
+
+_EMPTY_PROPERTIES: Mapping[str, str] = MappingProxyType({})
+
+
+class _PropsView(Mapping[str, str]):
+    """
+    Protobuf 屬性 map 的唯讀視圖
+
+    延遲複製節點屬性；需要真正的 dict（例如 JSON 序列化）時再呼叫 dict()。
+    """
+
+    __slots__ = ("_m",)
+
+    def __init__(self, m: Mapping[str, str]):
+        self._m = m
+
+    def __getitem__(self, key: str) -> str:
+        return self._m[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._m)
+
+    def __len__(self) -> int:
+        return len(self._m)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self._m)!r})"
+
+
+class SearchHit(NamedTuple):
+    """
+    單一搜尋結果
+
+    以不可變 tuple 取代逐筆建立的字典，快取中的結果可安全地共用；
+    需要字典時呼叫 _asdict()。
+    """
+
+    id: str
+    type: str
+    content: str
+    score: float
+    properties: Mapping[str, str]
+    labels: Tuple[str, ...]
+
+
+_make_hit = SearchHit._make
+
+
+def _node_to_hit(node: mcp_pb2.SearchResult) -> SearchHit:
+    """將 SearchResult 轉換為 SearchHit（屬性以唯讀視圖延遲複製）"""
+    return _make_hit(
+        (
+            node.node_id,
+            node.node_type,
+            node.content,
+            node.similarity_score,
+            _PropsView(node.properties) if node.properties else _EMPTY_PROPERTIES,
+            tuple(node.labels),
+        )
+    )
+
 
 class GrpcBridge:
     """
@@ -27,19 +104,27 @@ class GrpcBridge:
     - 實作健康檢查和監控
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, channel_pool_size: int = 1):
         """
         初始化 gRPC 橋接器
 
         Args:
             settings: 應用配置
+            channel_pool_size: gRPC 頻道數量，請求以輪詢方式分散到各頻道
         """
         self.settings = settings
         self.logger = structlog.get_logger(f"{__name__}.{self.__class__.__name__}")
 
         # gRPC 連線相關
+        grpc_host = getattr(settings, "grpc_host", "localhost")
+        grpc_port = getattr(settings, "grpc_port", 50052)
+        self._server_address = f"{grpc_host}:{grpc_port}"
         self.channel: Optional[grpc.aio.Channel] = None
         self.stub: Optional[mcp_pb2_grpc.MnemosyneMCPStub] = None
+        self.channel_pool_size = max(1, channel_pool_size)
+        self._channels: List[grpc.aio.Channel] = []
+        self._stubs: List[mcp_pb2_grpc.MnemosyneMCPStub] = []
+        self._rr_index = 0
         self._connection_lock = asyncio.Lock()
         self._is_connected = False
 
@@ -48,6 +133,9 @@ class GrpcBridge:
         self.timeout_seconds = 30.0
         self.health_check_timeout = 2.0
 
+        # 搜尋結果快取 (query, limit) -> 唯讀結果，僅快取成功的搜尋
+        self.search_cache = TTLCache(maxsize=1024, ttl=30.0)
+
         # 統計資訊
         self.stats = {
             "total_requests": 0,
@@ -65,26 +153,25 @@ class GrpcBridge:
 
             try:
                 # 建立 gRPC 頻道
-                grpc_host = getattr(self.settings, "grpc_host", "localhost")
-                grpc_port = getattr(self.settings, "grpc_port", 50052)
-                server_address = f"{grpc_host}:{grpc_port}"
-
-                self.logger.info("Connecting to gRPC service", address=server_address)
-
-                # 設置連線選項以提升可靠性
-                options = [
-                    ("grpc.keepalive_time_ms", 30000),
-                    ("grpc.keepalive_timeout_ms", 5000),
-                    ("grpc.keepalive_permit_without_calls", True),
-                    ("grpc.http2.max_pings_without_data", 0),
-                    ("grpc.http2.min_time_between_pings_ms", 10000),
-                    ("grpc.http2.min_ping_interval_without_data_ms", 300000),
-                ]
-
-                self.channel = grpc.aio.insecure_channel(
-                    server_address, options=options
+                self.logger.info(
+                    "Connecting to gRPC service",
+                    address=self._server_address,
+                    channel_pool_size=self.channel_pool_size,
                 )
-                self.stub = mcp_pb2_grpc.MnemosyneMCPStub(self.channel)
+
+                # 每個頻道使用不同的 channel_id，避免共用同一條 HTTP/2 連線
+                self._channels = [
+                    grpc.aio.insecure_channel(
+                        self._server_address,
+                        options=[*_GRPC_OPTIONS, ("grpc.channel_id", i)],
+                    )
+                    for i in range(self.channel_pool_size)
+                ]
+                self._stubs = [
+                    mcp_pb2_grpc.MnemosyneMCPStub(channel) for channel in self._channels
+                ]
+                self.channel = self._channels[0]
+                self.stub = self._stubs[0]
 
                 # 測試連線
                 await self.health_check()
@@ -106,17 +193,27 @@ class GrpcBridge:
     async def _cleanup_connection(self) -> None:
         """清理連線資源"""
         try:
-            if self.channel:
-                await self.channel.close()
+            for channel in self._channels:
+                await channel.close()
         except Exception as e:
             self.logger.warning("Error closing gRPC channel", error=str(e))
         finally:
+            self._channels = []
+            self._stubs = []
             self.channel = None
             self.stub = None
             self._is_connected = False
 
+    def next_stub(self) -> Optional[mcp_pb2_grpc.MnemosyneMCPStub]:
+        """以輪詢方式取得下一個頻道的 stub"""
+        stubs = self._stubs
+        if len(stubs) <= 1:
+            return self.stub
+        self._rr_index = (self._rr_index + 1) % len(stubs)
+        return stubs[self._rr_index]
+
     async def _ensure_connected(self) -> None:
-        """確保 gRPC 連線可用"""
+        """確保 gRPC 連線可用（冷路徑，呼叫端應先檢查 _is_connected）"""
         if not self._is_connected:
             await self.connect()
 
@@ -160,53 +257,58 @@ class GrpcBridge:
             self.logger.error("Unexpected health check error", error=str(e))
             return False
 
-    async def search_code(self, query: str, limit: int = 10) -> Dict[str, Any]:
+    async def search_code(self, query: str, limit: int = 10) -> Mapping[str, Any]:
         """
         搜尋程式碼
 
+        成功的結果為唯讀映射（results 為 tuple），快取命中時直接共用。
+
         Args:
             query: 搜尋查詢字串
             limit: 最大結果數量
 
         Returns:
-            搜尋結果字典
+            搜尋結果映射
         """
+        key = (query, limit)
+        # 快取命中不計入 gRPC 請求數與成功率
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            return cached
         self.stats["total_requests"] += 1
 
         try:
-            await self._ensure_connected()
+            if not self._is_connected:
+                await self._ensure_connected()
 
             # 建立 gRPC 請求
             request = mcp_pb2.SearchRequest(query_text=query, top_k=limit)
 
             # 執行搜尋
-            response = await self.stub.Search(request, timeout=self.timeout_seconds)
+            response = await self.next_stub().Search(
+                request, timeout=self.timeout_seconds
+            )
 
             # 轉換回應格式
-            result = {
-                "summary": response.summary,
-                "results": [
-                    {
-                        "id": node.node_id,
-                        "type": node.node_type,
-                        "content": node.content,
-                        "score": node.similarity_score,
-                        "properties": dict(node.properties) if node.properties else {},
-                        "labels": list(node.labels) if node.labels else [],
-                    }
-                    for node in response.relevant_nodes
-                ],
-                "total": len(response.relevant_nodes),
-                "suggested_next_step": response.suggested_next_step,
-            }
+            results = tuple(_node_to_hit(node) for node in response.relevant_nodes)
+            result: Mapping[str, Any] = MappingProxyType(
+                {
+                    "summary": response.summary,
+                    "results": results,
+                    "total": len(results),
+                    "suggested_next_step": response.suggested_next_step,
+                }
+            )
 
             self.stats["successful_requests"] += 1
             self.logger.info(
                 "Search completed successfully",
                 query=query,
-                results_count=len(result["results"]),
+                results_count=len(results),
             )
 
+            self.search_cache.set(key, result)
+
             return result
 
         except grpc.RpcError as e:
@@ -252,7 +354,8 @@ class GrpcBridge:
         self.stats["total_requests"] += 1
 
         try:
-            await self._ensure_connected()
+            if not self._is_connected:
+                await self._ensure_connected()
 
             # 建立 gRPC 請求
             request = mcp_pb2.ImpactAnalysisRequest(
@@ -260,7 +363,7 @@ class GrpcBridge:
             )
 
             # 執行影響分析
-            response = await self.stub.RunImpactAnalysis(request, timeout=60.0)
+            response = await self.next_stub().RunImpactAnalysis(request, timeout=60.0)
 
             # 轉換回應格式
             result = {
@@ -327,6 +430,8 @@ class GrpcBridge:
 
         return {
             **self.stats,
+            "cache_hits": self.search_cache.hits,
+            "cache_misses": self.search_cache.misses,
             "success_rate": round(
                 self.stats["successful_requests"] / total_requests * 100, 2
             ),
@@ -6,18 +6,30 @@ Mnemosyne MCP 伺服器主體，使用 FastMCP 框架提供標準的 Model Conte
 """
 
 import asyncio
+import os
 import sys
-from typing import Optional
+from typing import Any, Coroutine, Optional, TypeVar
 
 import structlog
 from fastmcp import FastMCP
 
 from ..core.config import Settings
 from .grpc_bridge import GrpcBridge
-from .tools import register_tools
+from .tools import TOOL_NAMES, register_tools
 
 logger = structlog.get_logger(__name__)
 
+_T = TypeVar("_T")
+
+# get_server_info 的固定欄位，呼叫時只補上動態狀態
+_SERVER_INFO_SKELETON = {
+    "name": "Mnemosyne MCP Server",
+    "version": "0.1.0",
+    "transport": "stdio",
+    "tools_count": len(TOOL_NAMES),
+    "tools": TOOL_NAMES,
+}
+
 
 class MnemosyneMCPServer:
     """
@@ -66,7 +78,7 @@ class MnemosyneMCPServer:
             self.logger.info("開始初始化 MCP 伺服器")
 
             # 建立並連線 gRPC 橋接器
-            self.grpc_bridge = GrpcBridge(self.settings)
+            self.grpc_bridge = GrpcBridge(self.settings, channel_pool_size=4)
             await self.grpc_bridge.connect()
 
             # 註冊 MCP 工具
@@ -141,8 +153,12 @@ class MnemosyneMCPServer:
             self.logger.info("非同步啟動 MCP 伺服器", transport=transport)
 
             if transport == "stdio":
-                # 使用 stdio 傳輸的非同步版本
-                await asyncio.to_thread(self.mcp.run)
+                # 直接在目前的事件迴圈上服務 stdio，與 gRPC 橋接器共用同一迴圈
+                run_stdio_async = getattr(self.mcp, "run_stdio_async", None)
+                if run_stdio_async is not None:
+                    await run_stdio_async()
+                else:
+                    await self.mcp.run_async(transport="stdio")
             else:
                 raise ValueError(f"不支援的傳輸方式: {transport}")
 
@@ -160,20 +176,9 @@ class MnemosyneMCPServer:
         Returns:
             伺服器狀態和統計資訊
         """
-        info = {
-            "name": "Mnemosyne MCP Server",
-            "version": "0.1.0",
-            "initialized": self._initialized,
-            "running": self._running,
-            "transport": "stdio",
-            "tools_count": 4,  # search_code, analyze_impact, health_status, get_system_info
-            "tools": [
-                "search_code",
-                "analyze_impact",
-                "health_status",
-                "get_system_info",
-            ],
-        }
+        info = _SERVER_INFO_SKELETON.copy()
+        info["initialized"] = self._initialized
+        info["running"] = self._running
 
         # 如果橋接器可用，添加連線統計
         if self.grpc_bridge:
@@ -197,6 +202,21 @@ async def create_mcp_server(settings: Optional[Settings] = None) -> MnemosyneMCP
     return server
 
 
+def run_event_loop(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    執行 coroutine 直到完成
+
+    若已安裝 uvloop（uvicorn[standard] 於非 Windows 平台會一併安裝）則使用 uvloop
+    事件迴圈，否則退回標準的 asyncio.run。
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    return uvloop.run(coro)
+
+
 async def main() -> None:
     """
     主程式入口點
@@ -208,20 +228,29 @@ async def main() -> None:
         # 設定日誌格式 (for stdio mode)
         import logging
 
+        log_level = getattr(
+            logging, os.getenv("MNEMOSYNE_LOG_LEVEL", "INFO").upper(), logging.INFO
+        )
         logging.basicConfig(
-            level=logging.INFO,
+            level=log_level,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             stream=sys.stderr,  # 將日誌輸出到 stderr，避免干擾 stdio 通訊
         )
 
+        # 低於設定級別的 structlog 呼叫直接成為 no-op，不再經過處理器
+        structlog.configure(
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+        )
+
         # 建立並啟動伺服器
         settings = Settings()
         server = await create_mcp_server(settings)
 
         logger.info("Mnemosyne MCP Server 準備就緒")
 
-        # 啟動伺服器 (阻塞式)
-        server.run()
+        # 在同一事件迴圈上啟動伺服器，直到客戶端斷線
+        await server.run_async()
 
     except KeyboardInterrupt:
         logger.info("收到中斷信號，伺服器正常退出")
@@ -232,4 +261,4 @@ async def main() -> None:
 
 if __name__ == "__main__":
     # 直接執行此檔案啟動 MCP 伺服器
-    asyncio.run(main())
+    run_event_loop(main())
@@ -5,22 +5,101 @@ FastMCP 工具定義
 每個工具都包含詳細的文檔和參數驗證。
 """
 
+import asyncio
+from typing import Dict, Tuple
+
 import structlog
 from fastmcp import FastMCP
 
+from ..schemas.api import AnalyzeImpactArgs, SearchCodeArgs
 from .grpc_bridge import GrpcBridge
 from .utils import (
+    MAX_DISPLAY_RESULTS,
+    TTLCache,
     format_impact_analysis,
     format_search_results,
     mcp_tool_wrapper,
-    validate_non_empty_string,
-    validate_positive_integer,
-    validate_query_length,
-    validate_tool_params,
 )
 
 logger = structlog.get_logger(__name__)
 
+# register_tools 註冊的工具名稱
+TOOL_NAMES = (
+    "search_code",
+    "analyze_impact",
+    "health_status",
+    "get_system_info",
+    "get_cache_stats",
+)
+
+# get_system_info 的固定回應內容
+_SYSTEM_INFO_TEXT = """🚀 **Mnemosyne MCP - 智能程式碼知識圖譜**
+
+📋 **系統概覽:**
+Mnemosyne 是一個主動的、有狀態的軟體知識圖譜引擎，專為 AI 代理和開發者協作而設計。
+它使用圖資料庫技術和語義搜尋，幫助您快速理解和導航大型程式碼庫。
+
+🛠️ **可用工具:**
+
+1. **search_code** - 程式碼搜尋
+   • 使用自然語言或關鍵字搜尋相關程式碼
+   • 支援語義理解，能找到概念相關的程式碼
+   • 範例: `search_code("user authentication", 10)`
+
+2. **analyze_impact** - 影響分析
+   • 分析程式碼變更對專案的影響範圍
+   • 評估變更風險等級 (LOW/MEDIUM/HIGH)
+   • 範例: `analyze_impact("my-project", "PR-123")`
+
+3. **health_status** - 系統健康檢查
+   • 檢查所有系統組件的運行狀態
+   • 提供效能統計和錯誤資訊
+   • 範例: `health_status()`
+
+4. **get_system_info** - 系統資訊 (當前工具)
+   • 顯示系統概覽和使用說明
+
+5. **get_cache_stats** - 快取統計
+   • 顯示工具回應快取的命中次數與命中率
+   • 範例: `get_cache_stats()`
+
+💡 **使用建議:**
+- 搜尋時使用描述性的查詢，例如「處理付款的函數」而不只是「payment」
+- 影響分析適合在程式碼審核時使用，幫助評估變更風險
+- 定期使用健康檢查確保系統運行正常
+
+🔗 **技術架構:**
+- gRPC-First 設計，確保高效能和可靠性
+- FastMCP 協議適配，與 Claude Desktop 等客戶端無縫整合
+- FalkorDB 圖資料庫，提供強大的圖查詢能力
+
+📞 **需要幫助?**
+使用任何工具時，您都會收到詳細的回饋和建議。如果遇到問題，請先執行 `health_status()` 檢查系統狀態。
+"""
+
+# health_status 的回應模板（以 get_stats() 結果填入）
+_HEALTHY_STATUS_TEMPLATE = (
+    "✅ **Mnemosyne 系統運行正常**\n\n"
+    "🔗 **連線狀態:**\n"
+    "   • gRPC 服務: {connection_status}\n"
+    "   • 總請求數: {total_requests}\n"
+    "   • 成功率: {success_rate}%\n"
+    "   • 健康檢查次數: {health_checks}\n\n"
+)
+_FAILED_REQUESTS_NOTICE = "⚠️ **注意**: 有 {failed_requests} 個失敗的請求\n"
+_HEALTHY_STATUS_FOOTER = "💡 **系統就緒，可以處理查詢和分析請求**"
+_UNHEALTHY_STATUS_TEMPLATE = (
+    "❌ **Mnemosyne 系統異常**\n\n"
+    "🔗 **連線狀態:**\n"
+    "   • gRPC 服務: {connection_status}\n"
+    "   • 連線錯誤數: {connection_errors}\n"
+    "   • 失敗請求數: {failed_requests}\n\n"
+    "🔧 **建議動作:**\n"
+    "   1. 檢查 gRPC 服務是否運行\n"
+    "   2. 驗證網路連線\n"
+    "   3. 查看系統日誌獲取詳細錯誤資訊"
+)
+
 
 def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
     """
@@ -30,13 +109,37 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
         mcp: FastMCP 伺服器實例
         bridge: gRPC 橋接器實例
     """
+    # 影響分析回應快取；搜尋結果由 GrpcBridge.search_cache 快取
+    impact_cache = TTLCache(maxsize=256, ttl=15.0)
+    # 進行中的搜尋：相同查詢同時到達時共用同一次 gRPC 呼叫
+    search_inflight: Dict[Tuple[str, int, bool], asyncio.Task] = {}
+    # 健康狀態短暫快取；鎖確保同時多個呼叫只會發出一次健康檢查 RPC
+    health_cache = TTLCache(maxsize=1, ttl=2.0)
+    health_lock = asyncio.Lock()
+
+    # 每個工具預先綁定 tool 欄位的日誌記錄器
+    search_log = logger.bind(tool="search_code")
+    impact_log = logger.bind(tool="analyze_impact")
+    health_log = logger.bind(tool="health_status")
+    info_log = logger.bind(tool="get_system_info")
+
+    async def fetch_search(query: str, limit: int, limit_capped: bool) -> str:
+        """呼叫 gRPC 搜尋（橋接器負責快取）並格式化結果"""
+        search_log.info("執行程式碼搜尋", query=query, limit=limit)
+
+        # 呼叫 gRPC 服務
+        result = await bridge.search_code(query, limit)
+
+        # 格式化回應
+        return format_search_results(
+            results=result["results"],
+            total=result["total"],
+            summary=result["summary"],
+            limit_capped=limit_capped,
+        )
 
     @mcp.tool()
-    @mcp_tool_wrapper
-    @validate_tool_params(
-        query=lambda x: (validate_non_empty_string(x), validate_query_length(x)),
-        limit=validate_positive_integer,
-    )
+    @mcp_tool_wrapper(error_prefix="搜尋失敗")
     async def search_code(query: str, limit: int = 10) -> str:
         """
         在 Mnemosyne 知識圖譜中搜尋程式碼
@@ -47,39 +150,35 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
         Args:
             query: 搜尋查詢 (自然語言或關鍵字)
                   例如：「處理用戶登入的函數」、「database connection」、「error handling」
-            limit: 返回結果的最大數量 (1-50，預設 10)
+            limit: 返回結果的最大數量 (預設 10；最多返回 5 個，
+                  超過時會提示可能還有更多結果)
 
         Returns:
             格式化的搜尋結果，包含相關程式碼片段、檔案位置和相似度分數
 
         Examples:
             - search_code("user authentication functions", 5)
-            - search_code("SQL query builders", 15)
+            - search_code("SQL query builders", 3)
             - search_code("錯誤處理機制")
         """
-        try:
-            # 參數範圍驗證
-            limit = max(1, min(limit, 50))  # 限制在合理範圍內
-
-            logger.info("執行程式碼搜尋", query=query, limit=limit)
-
-            # 呼叫 gRPC 服務
-            result = await bridge.search_code(query, limit)
-
-            # 格式化回應
-            return format_search_results(
-                results=result["results"],
-                total=result["total"],
-                summary=result["summary"],
-            )
-
-        except Exception as e:
-            logger.error("程式碼搜尋失敗", query=query, error=str(e))
-            return f"⚠️ 搜尋失敗: {str(e)}"
+        args = SearchCodeArgs(query=query, limit=limit)
+        query = args.query
+        # 只向 gRPC 服務請求實際會顯示的結果數量
+        limit = min(args.limit, MAX_DISPLAY_RESULTS)
+        limit_capped = args.limit > limit
+
+        key = (query, limit, limit_capped)
+        task = search_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch_search(query, limit, limit_capped))
+            search_inflight[key] = task
+            task.add_done_callback(lambda _: search_inflight.pop(key, None))
+
+        # shield：單一呼叫者被取消時不影響其他等待同一結果的呼叫者
+        return await asyncio.shield(task)
 
     @mcp.tool()
-    @mcp_tool_wrapper
-    @validate_tool_params(project_id=validate_non_empty_string)
+    @mcp_tool_wrapper(error_prefix="影響分析失敗")
     async def analyze_impact(project_id: str, pr_number: str = "") -> str:
         """
         分析程式碼變更的影響範圍和風險等級
@@ -102,25 +201,29 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
             - analyze_impact("web-frontend")  # 分析最新變更
             - analyze_impact("mobile-app", "pr-456")
         """
-        try:
-            logger.info(
-                "執行影響分析", project_id=project_id, pr_number=pr_number or "latest"
-            )
+        args = AnalyzeImpactArgs(project_id=project_id, pr_number=pr_number)
+        project_id, pr_number = args.project_id, args.pr_number
 
-            # 呼叫 gRPC 服務
-            result = await bridge.analyze_impact(project_id, pr_number)
+        key = (project_id, pr_number)
+        cached = impact_cache.get(key)
+        if cached is not None:
+            return cached
 
-            # 格式化回應
-            return format_impact_analysis(result)
+        impact_log.info(
+            "執行影響分析", project_id=project_id, pr_number=pr_number or "latest"
+        )
 
-        except Exception as e:
-            logger.error(
-                "影響分析失敗", project_id=project_id, pr_number=pr_number, error=str(e)
-            )
-            return f"⚠️ 影響分析失敗: {str(e)}"
+        # 呼叫 gRPC 服務
+        result = await bridge.analyze_impact(project_id, pr_number)
+
+        # 格式化回應
+        text = format_impact_analysis(result)
+        if "error" not in result:
+            impact_cache.set(key, text)
+        return text
 
     @mcp.tool()
-    @mcp_tool_wrapper
+    @mcp_tool_wrapper(error_prefix="健康檢查失敗")
     async def health_status() -> str:
         """
         檢查 Mnemosyne 系統的健康狀態
@@ -131,14 +234,20 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
         - 系統效能指標
         - 最近的錯誤統計
 
+        檢查結果會快取 2 秒，頻繁輪詢不會重複發出 gRPC 請求。
+
         Returns:
             系統健康狀態報告
 
         Examples:
             - health_status()  # 簡單的健康檢查
         """
-        try:
-            logger.info("執行系統健康檢查")
+        async with health_lock:
+            status_text = health_cache.get("health_status")
+            if status_text is not None:
+                return status_text
+
+            health_log.info("執行系統健康檢查")
 
             # 執行健康檢查
             is_healthy = await bridge.health_check()
@@ -147,36 +256,18 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
             stats = bridge.get_stats()
 
             if is_healthy:
-                status_text = "✅ **Mnemosyne 系統運行正常**\n\n"
-                status_text += "🔗 **連線狀態:**\n"
-                status_text += f"   • gRPC 服務: {stats['connection_status']}\n"
-                status_text += f"   • 總請求數: {stats['total_requests']}\n"
-                status_text += f"   • 成功率: {stats['success_rate']}%\n"
-                status_text += f"   • 健康檢查次數: {stats['health_checks']}\n\n"
-
+                status_text = _HEALTHY_STATUS_TEMPLATE.format_map(stats)
                 if stats["failed_requests"] > 0:
-                    status_text += f"⚠️ **注意**: 有 {stats['failed_requests']} 個失敗的請求\n"
-
-                status_text += "💡 **系統就緒，可以處理查詢和分析請求**"
+                    status_text += _FAILED_REQUESTS_NOTICE.format_map(stats)
+                status_text += _HEALTHY_STATUS_FOOTER
             else:
-                status_text = "❌ **Mnemosyne 系統異常**\n\n"
-                status_text += "🔗 **連線狀態:**\n"
-                status_text += f"   • gRPC 服務: {stats['connection_status']}\n"
-                status_text += f"   • 連線錯誤數: {stats['connection_errors']}\n"
-                status_text += f"   • 失敗請求數: {stats['failed_requests']}\n\n"
-                status_text += "🔧 **建議動作:**\n"
-                status_text += "   1. 檢查 gRPC 服務是否運行\n"
-                status_text += "   2. 驗證網路連線\n"
-                status_text += "   3. 查看系統日誌獲取詳細錯誤資訊"
+                status_text = _UNHEALTHY_STATUS_TEMPLATE.format_map(stats)
 
+            health_cache.set("health_status", status_text)
             return status_text
 
-        except Exception as e:
-            logger.error("健康檢查失敗", error=str(e))
-            return f"⚠️ 健康檢查失敗: {str(e)}"
-
     @mcp.tool()
-    @mcp_tool_wrapper
+    @mcp_tool_wrapper(error_prefix="無法獲取系統資訊")
     async def get_system_info() -> str:
         """
         獲取 Mnemosyne 系統資訊和使用說明
@@ -186,59 +277,31 @@ def register_tools(mcp: FastMCP, bridge: GrpcBridge) -> None:
         Returns:
             系統資訊和使用說明
         """
-        try:
-            info_text = """🚀 **Mnemosyne MCP - 智能程式碼知識圖譜**
+        info_log.info("提供系統資訊")
+        return _SYSTEM_INFO_TEXT
 
-📋 **系統概覽:**
-Mnemosyne 是一個主動的、有狀態的軟體知識圖譜引擎，專為 AI 代理和開發者協作而設計。
-它使用圖資料庫技術和語義搜尋，幫助您快速理解和導航大型程式碼庫。
-
-🛠️ **可用工具:**
-
-1. **search_code** - 程式碼搜尋
-   • 使用自然語言或關鍵字搜尋相關程式碼
-   • 支援語義理解，能找到概念相關的程式碼
-   • 範例: `search_code("user authentication", 10)`
-
-2. **analyze_impact** - 影響分析
-   • 分析程式碼變更對專案的影響範圍
-   • 評估變更風險等級 (LOW/MEDIUM/HIGH)
-   • 範例: `analyze_impact("my-project", "PR-123")`
-
-3. **health_status** - 系統健康檢查
-   • 檢查所有系統組件的運行狀態
-   • 提供效能統計和錯誤資訊
-   • 範例: `health_status()`
-
-4. **get_system_info** - 系統資訊 (當前工具)
-   • 顯示系統概覽和使用說明
-
-💡 **使用建議:**
-- 搜尋時使用描述性的查詢，例如「處理付款的函數」而不只是「payment」
-- 影響分析適合在程式碼審核時使用，幫助評估變更風險
-- 定期使用健康檢查確保系統運行正常
-
-🔗 **技術架構:**
-- gRPC-First 設計，確保高效能和可靠性
-- FastMCP 協議適配，與 Claude Desktop 等客戶端無縫整合
-- FalkorDB 圖資料庫，提供強大的圖查詢能力
-
-📞 **需要幫助?**
-使用任何工具時，您都會收到詳細的回饋和建議。如果遇到問題，請先執行 `health_status()` 檢查系統狀態。
-"""
-
-            logger.info("提供系統資訊")
-            return info_text
+    @mcp.tool()
+    @mcp_tool_wrapper
+    async def get_cache_stats() -> str:
+        """
+        獲取 MCP 工具回應快取的統計資訊
 
-        except Exception as e:
-            logger.error("獲取系統資訊失敗", error=str(e))
-            return f"⚠️ 無法獲取系統資訊: {str(e)}"
+        Returns:
+            各工具快取的大小、命中次數與命中率
+        """
+        lines = ["📦 **工具快取統計:**\n"]
+        for name, cache in (
+            ("search_code", bridge.search_cache),
+            ("analyze_impact", impact_cache),
+            ("health_status", health_cache),
+        ):
+            stats = cache.stats()
+            lines.append(
+                f"   • {name}: 命中 {stats['hits']} / 未命中 {stats['misses']} "
+                f"(命中率 {stats['hit_rate']}%，"
+                f"項目 {stats['size']}/{stats['maxsize']}，TTL {stats['ttl_seconds']}s)"
+            )
+        return "\n".join(lines)
 
     # 記錄工具註冊完成
-    tools_registered = [
-        "search_code",
-        "analyze_impact",
-        "health_status",
-        "get_system_info",
-    ]
-    logger.info("MCP 工具註冊完成", tools_count=len(tools_registered), tools=tools_registered)
+    logger.info("MCP 工具註冊完成", tools_count=len(TOOL_NAMES), tools=TOOL_NAMES)
@@ -6,14 +6,91 @@ MCP Adapter 工具函數
 
 import functools
 import time
-from typing import Any, Callable
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# 搜尋結果最多顯示的項目數，避免輸出過長
+MAX_DISPLAY_RESULTS = 5
 
-def mcp_tool_wrapper(func: Callable) -> Callable:
+# 搜尋結果內容預覽的最大字元數
+_CONTENT_PREVIEW_CHARS = 200
+
+# 風險等級對應的圖示
+_RISK_EMOJI = MappingProxyType(
+    {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴", "UNKNOWN": "⚪"}
+)
+
+# 影響分析結果的顯示模板
+_IMPACT_TMPL = (
+    "🎯 影響力分析結果:\n\n"
+    "{icon} 風險等級: {level}\n"
+    "📊 影響節點數: {nodes}\n\n"
+    "📝 分析摘要:\n{summary}"
+)
+
+
+class TTLCache:
+    """
+    具存活時間的 LRU 快取
+
+    用於快取工具回應；超過 ttl 秒的項目視為失效，超過 maxsize 時淘汰最久未使用者。
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """取得未過期的快取值，不存在或已過期時返回 None"""
+        entry = self._data.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """寫入快取值"""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """快取統計資訊"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+def _fmt_err(prefix: str, e: BaseException) -> str:
+    """組合工具的錯誤回應，包含例外類型方便除錯"""
+    detail = str(e)
+    if detail:
+        return f"⚠️ {prefix}: {type(e).__name__}: {detail}"
+    return f"⚠️ {prefix}: {type(e).__name__}"
+
+
+def mcp_tool_wrapper(
+    func: Optional[Callable] = None, *, error_prefix: Optional[str] = None
+) -> Callable:
     """
     MCP 工具的通用錯誤處理裝飾器
 
@@ -21,58 +98,83 @@ def mcp_tool_wrapper(func: Callable) -> Callable:
     - 統一的錯誤處理和日誌記錄
     - 執行時間監控
     - 優雅的錯誤回應格式
+
+    可直接使用 @mcp_tool_wrapper，或以 @mcp_tool_wrapper(error_prefix="搜尋失敗")
+    指定錯誤回應的前綴。
     """
+    if func is None:
+        return functools.partial(mcp_tool_wrapper, error_prefix=error_prefix)
+
+    tool_name = func.__name__
+    tool_logger = logger.bind(tool=tool_name)
+    if error_prefix is None:
+        error_prefix = f"工具 '{tool_name}' 執行失敗"
 
     @functools.wraps(func)
     async def wrapper(*args, **kwargs) -> str:
-        start_time = time.time()
-        tool_name = func.__name__
+        start_ns = time.perf_counter_ns()
 
         try:
-            logger.info(
+            tool_logger.info(
                 "MCP tool execution started",
-                tool=tool_name,
                 args_count=len(args),
-                kwargs_keys=list(kwargs.keys()),
+                kwargs_count=len(kwargs),
             )
 
             result = await func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
-            logger.info(
+            tool_logger.info(
                 "MCP tool executed successfully",
-                tool=tool_name,
-                duration_ms=round(duration * 1000, 2),
-                result_length=len(str(result)) if result else 0,
+                duration_ms=round(duration_ms, 2),
+                result_length=len(result) if isinstance(result, str) else 0,
             )
 
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
-            logger.error(
+            tool_logger.error(
                 "MCP tool execution failed",
-                tool=tool_name,
-                error=str(e),
+                error=e,
                 error_type=type(e).__name__,
-                duration_ms=round(duration * 1000, 2),
+                duration_ms=round(duration_ms, 2),
             )
 
             # 返回用戶友好的錯誤訊息
-            return f"⚠️ 工具 '{tool_name}' 執行失敗: {str(e)}"
+            return _fmt_err(error_prefix, e)
 
     return wrapper
 
 
-def format_search_results(results: list, total: int, summary: str) -> str:
+def _format_search_item(i: int, item: Any) -> str:
+    """格式化單一搜尋結果（GrpcBridge 產生的 SearchHit）"""
+    item_id, item_type, content, score = item[:4]
+
+    content_preview = (
+        content[:_CONTENT_PREVIEW_CHARS] + "..."
+        if len(content) > _CONTENT_PREVIEW_CHARS
+        else content
+    )
+    return (
+        f"{i}. 📁 {item_type}: {item_id}\n"
+        f"   💯 相似度: {score:.2f}\n"
+        f"   📝 內容: {content_preview}"
+    )
+
+
+def format_search_results(
+    results: Sequence[Any], total: int, summary: str, limit_capped: bool = False
+) -> str:
     """
     格式化搜尋結果為用戶友好的顯示格式
 
     Args:
-        results: 搜尋結果列表
+        results: 搜尋結果列表（SearchHit）
         total: 總結果數
         summary: 搜尋摘要
+        limit_capped: 請求的數量是否超過 MAX_DISPLAY_RESULTS 而被截斷
 
     Returns:
         格式化的搜尋結果字串
@@ -80,27 +182,16 @@ def format_search_results(results: list, total: int, summary: str) -> str:
     if not results:
         return f"❌ 沒有找到相關結果\n📋 摘要: {summary}"
 
-    # 限制顯示結果數量，避免輸出過長
-    display_results = results[:5]
-
-    formatted_items = []
-    for i, item in enumerate(display_results, 1):
-        content_preview = item.get("content", "")
-        if len(content_preview) > 200:
-            content_preview = content_preview[:200] + "..."
-
-        formatted_items.append(
-            f"{i}. 📁 {item.get('type', 'Unknown')}: {item.get('id', 'N/A')}\n"
-            f"   💯 相似度: {item.get('score', 0):.2f}\n"
-            f"   📝 內容: {content_preview}"
-        )
-
-    result_text = f"🔍 搜尋結果 (顯示前 {len(display_results)} 個，共 {total} 個結果):\n\n"
-    result_text += "\n\n".join(formatted_items)
+    # 結果數量已由 search_code 限制在 MAX_DISPLAY_RESULTS 以內
+    result_text = f"🔍 搜尋結果 (共 {total} 個結果):\n\n"
+    result_text += "\n\n".join(
+        _format_search_item(i, item) for i, item in enumerate(results, 1)
+    )
     result_text += f"\n\n📋 摘要: {summary}"
 
-    if total > len(display_results):
-        result_text += f"\n\n💡 提示: 還有 {total - len(display_results)} 個結果未顯示"
+    # gRPC 回應不含總數；請求數量被截斷且結果已滿時，可能還有未顯示的結果
+    if limit_capped and total >= MAX_DISPLAY_RESULTS:
+        result_text += f"\n\n💡 提示: 最多顯示 {MAX_DISPLAY_RESULTS} 個結果，可能還有更多結果未顯示"
 
     return result_text
 
@@ -115,61 +206,11 @@ def format_impact_analysis(result: dict) -> str:
     Returns:
         格式化的影響分析字串
     """
-    risk_emoji = {"LOW": "🟢", "MEDIUM": "🟡", "HIGH": "🔴", "UNKNOWN": "⚪"}
-
     risk_level = result.get("risk_level", "UNKNOWN")
-    risk_icon = risk_emoji.get(risk_level, "⚪")
-
-    impact_text = "🎯 影響力分析結果:\n\n"
-    impact_text += f"{risk_icon} 風險等級: {risk_level}\n"
-    impact_text += f"📊 影響節點數: {result.get('impact_nodes', 0)}\n\n"
-    impact_text += f"📝 分析摘要:\n{result.get('summary', '無摘要資訊')}"
-
-    return impact_text
-
-
-def validate_tool_params(**validators) -> Callable:
-    """
-    參數驗證裝飾器
-
-    Args:
-        **validators: 參數名稱到驗證函數的映射
-
-    Returns:
-        裝飾器函數
-    """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            # 驗證參數
-            for param_name, validator in validators.items():
-                if param_name in kwargs:
-                    try:
-                        validator(kwargs[param_name])
-                    except Exception as e:
-                        raise ValueError(f"參數 '{param_name}' 驗證失敗: {str(e)}")
-
-            return await func(*args, **kwargs)
-
-        return wrapper
-
-    return decorator
-
-
-def validate_non_empty_string(value: Any) -> None:
-    """驗證非空字串"""
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError("必須是非空字串")
-
-
-def validate_positive_integer(value: Any) -> None:
-    """驗證正整數"""
-    if not isinstance(value, int) or value <= 0:
-        raise ValueError("必須是正整數")
-
 
-def validate_query_length(value: str, max_length: int = 1000) -> None:
-    """驗證查詢字串長度"""
-    if len(value) > max_length:
-        raise ValueError(f"查詢字串長度不能超過 {max_length} 字元")
+    return _IMPACT_TMPL.format(
+        icon=_RISK_EMOJI.get(risk_level, "⚪"),
+        level=risk_level,
+        nodes=result.get("impact_nodes", 0),
+        summary=result.get("summary", "無摘要資訊"),
+    )
@@ -4,6 +4,8 @@ API 數據模型定義
 定義了 API 請求和響應的數據模型。
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -45,7 +47,7 @@ class HealthResponse(BaseModel):
     uptime_seconds: Optional[float] = Field(default=None, description="運行時間（秒）")
     memory_usage_mb: Optional[float] = Field(default=None, description="內存使用（MB）")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 class ErrorResponse(BaseModel):
@@ -57,7 +59,7 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="錯誤時間")
     trace_id: Optional[str] = Field(default=None, description="追蹤ID")
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
 
 class IngestRequest(BaseModel):
@@ -97,7 +99,7 @@ class IngestResponse(BaseModel):
     # 進度信息
     progress_url: Optional[str] = Field(default=None, description="進度查詢URL")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 class TaskStatusResponse(BaseModel):
@@ -125,7 +127,8 @@ class TaskStatusResponse(BaseModel):
     entities_created: Optional[int] = Field(default=None, description="創建實體數")
     relationships_created: Optional[int] = Field(default=None, description="創建關係數")
 
-    model_config = ConfigDict(use_enum_values=True)
+    # 非熱路徑模型，延遲到首次驗證時才建構 schema
+    model_config = ConfigDict(frozen=True, use_enum_values=True, defer_build=True)
 
 
 class SearchRequest(BaseModel):
@@ -178,6 +181,8 @@ class SearchResponse(BaseModel):
     # 建議
     suggestions: List[str] = Field(default_factory=list, description="搜索建議")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ImpactAnalysisRequest(BaseModel):
     """影響分析請求模型"""
@@ -192,6 +197,8 @@ class ImpactAnalysisRequest(BaseModel):
     # 過濾選項
     exclude_entity_types: List[str] = Field(default_factory=list, description="排除的實體類型")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ImpactAnalysisResponse(BaseModel):
     """影響分析響應模型"""
@@ -219,3 +226,23 @@ class ImpactAnalysisResponse(BaseModel):
     # 執行信息
     execution_time_ms: float = Field(description="執行時間（毫秒）")
     analysis_depth: int = Field(description="實際分析深度")
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class SearchCodeArgs(BaseModel):
+    """MCP search_code 工具參數模型"""
+
+    query: str = Field(
+        min_length=1, max_length=1000, pattern=r"\S", description="搜尋查詢"
+    )
+    limit: int = Field(
+        default=10, ge=1, description="最大結果數（最多返回 5 個，超過時截斷並提示）"
+    )
+
+
+class AnalyzeImpactArgs(BaseModel):
+    """MCP analyze_impact 工具參數模型"""
+
+    project_id: str = Field(min_length=1, pattern=r"\S", description="專案識別符")
+    pr_number: str = Field(default="", description="Pull Request 編號")
@@ -38,22 +38,19 @@ class AtlassianEntity(BaseModel):
     created_at: Optional[datetime] = Field(default=None, description="創建時間")
     updated_at: Optional[datetime] = Field(default=None, description="更新時間")
 
-    model_config = ConfigDict(use_enum_values=True)
-
     def to_graph_properties(self) -> Dict[str, Any]:
         """轉換為圖資料庫屬性格式"""
-        props = {
-            "id": self.id,
-            "entity_type": self.entity_type,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-        # 合併實體屬性
-        props.update(self.properties)
-
-        # 移除 None 值
-        return {k: v for k, v in props.items() if v is not None}
+        # 直接建構結果字典，時間轉為 ISO 8601 字串並略過 None 值
+        props: Dict[str, Any] = {"id": self.id, "entity_type": self.entity_type}
+        if self.created_at is not None:
+            props["created_at"] = self.created_at.isoformat()
+        if self.updated_at is not None:
+            props["updated_at"] = self.updated_at.isoformat()
+
+        for key, value in self.properties.items():
+            if value is not None:
+                props[key] = value
+        return props
 
     @property
     def project_key(self) -> Optional[str]:
@@ -90,20 +87,21 @@ class AtlassianRelationship(BaseModel):
 
     def to_graph_properties(self) -> Dict[str, Any]:
         """轉換為圖資料庫屬性格式"""
-        props = {
+        # 直接建構結果字典，時間轉為 ISO 8601 字串並略過 None 值
+        props: Dict[str, Any] = {
             "id": self.id,
             "source_id": self.source_id,
             "target_id": self.target_id,
-            "relationship_type": str(self.relationship_type),
+            "relationship_type": self.relationship_type,
             "strength": self.strength,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+        if self.created_at is not None:
+            props["created_at"] = self.created_at.isoformat()
 
-        # 合併關係屬性
-        props.update(self.properties)
-
-        # 移除 None 值
-        return {k: v for k, v in props.items() if v is not None}
+        for key, value in self.properties.items():
+            if value is not None:
+                props[key] = value
+        return props
 
 
 class AtlassianExtractionMetadata(BaseModel):
@@ -122,7 +120,7 @@ class AtlassianExtractionMetadata(BaseModel):
     warnings: List[str] = Field(default_factory=list, description="警告訊息")
     errors: List[str] = Field(default_factory=list, description="錯誤訊息")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(frozen=True)
 
 
 class AtlassianConfig(BaseModel):
@@ -139,4 +137,4 @@ class AtlassianConfig(BaseModel):
     included_fields: List[str] = Field(default_factory=list, description="包含的欄位")
     excluded_fields: List[str] = Field(default_factory=list, description="排除的欄位")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(frozen=True)
@@ -4,12 +4,13 @@
 定義了治理相關的數據模型，用於 Sprint 3 的約束和鎖定功能。
 """
 
-import uuid
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .core import uuid4_str
 
 
 class ConstraintType(str, Enum):
@@ -49,7 +50,7 @@ class Constraint(BaseModel):
     定義了對程式碼實體的約束規則。
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="約束唯一標識符")
+    id: str = Field(default_factory=uuid4_str, description="約束唯一標識符")
     name: str = Field(description="約束名稱")
     constraint_type: ConstraintType = Field(description="約束類型")
     description: str = Field(description="約束描述")
@@ -81,13 +82,12 @@ class Constraint(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-    @field_validator("expires_at")
-    @classmethod
-    def validate_expiry(cls, v: Optional[datetime], info) -> Optional[datetime]:
+    @model_validator(mode="after")
+    def validate_expiry(self) -> "Constraint":
         """驗證過期時間"""
-        if v and info.data.get("created_at") and v <= info.data["created_at"]:
+        if self.expires_at and self.expires_at <= self.created_at:
             raise ValueError("Expiry time must be after creation time")
-        return v
+        return self
 
     @property
     def is_expired(self) -> bool:
@@ -103,9 +103,10 @@ class Constraint(BaseModel):
 
     def record_violation(self) -> None:
         """記錄違規"""
+        now = datetime.now()
         self.violation_count += 1
-        self.last_violation = datetime.now()
-        self.updated_at = datetime.now()
+        self.last_violation = now
+        self.updated_at = now
 
 
 class Lock(BaseModel):
@@ -115,7 +116,7 @@ class Lock(BaseModel):
     用於協調多代理的並行操作，防止衝突。
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="鎖定唯一標識符")
+    id: str = Field(default_factory=uuid4_str, description="鎖定唯一標識符")
     target_entity_id: str = Field(description="被鎖定的實體ID")
     target_entity_type: str = Field(description="被鎖定的實體類型")
 
@@ -143,21 +144,14 @@ class Lock(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-    @field_validator("expires_at")
-    @classmethod
-    def validate_expiry(cls, v: Optional[datetime], info) -> Optional[datetime]:
-        """驗證過期時間"""
-        if v and info.data.get("acquired_at") and v <= info.data["acquired_at"]:
+    @model_validator(mode="after")
+    def validate_times(self) -> "Lock":
+        """驗證過期時間與釋放時間"""
+        if self.expires_at and self.expires_at <= self.acquired_at:
             raise ValueError("Expiry time must be after acquisition time")
-        return v
-
-    @field_validator("released_at")
-    @classmethod
-    def validate_release_time(cls, v: Optional[datetime], info) -> Optional[datetime]:
-        """驗證釋放時間"""
-        if v and info.data.get("acquired_at") and v < info.data["acquired_at"]:
+        if self.released_at and self.released_at < self.acquired_at:
             raise ValueError("Release time must be after acquisition time")
-        return v
+        return self
 
     @property
     def is_expired(self) -> bool:
@@ -205,7 +199,7 @@ class ConstraintViolation(BaseModel):
     記錄約束違規的詳細信息。
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="違規唯一標識符")
+    id: str = Field(default_factory=uuid4_str, description="違規唯一標識符")
     constraint_id: str = Field(description="違反的約束ID")
     entity_id: str = Field(description="違規實體ID")
     entity_type: str = Field(description="違規實體類型")
@@ -5,12 +5,36 @@
 """
 
 import hashlib
-import uuid
+import os
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_validator,
+)
+
+# UUID 第 4 版的版本與變體位元遮罩
+_UUID4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+_EntityT = TypeVar("_EntityT", bound="BaseEntity")
+
+
+def uuid4_str() -> str:
+    """
+    產生隨機 UUID（第 4 版）字串
+
+    與 str(uuid.uuid4()) 格式相同，但直接格式化隨機位元，
+    省去建立 UUID 物件的成本；用於大量建立實體時的預設 ID。
+    """
+    h = "%032x" % (int.from_bytes(os.urandom(16), "big") & _UUID4_CLEAR | _UUID4_SET)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class EntityType(str, Enum):
@@ -37,7 +61,7 @@ class BaseEntity(BaseModel):
     所有圖譜節點的基礎類，提供通用的屬性和方法。
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="唯一標識符")
+    id: str = Field(default_factory=uuid4_str, description="唯一標識符")
     entity_type: EntityType = Field(description="實體類型")
     name: str = Field(description="實體名稱")
     created_at: datetime = Field(default_factory=datetime.now, description="創建時間")
@@ -48,11 +72,41 @@ class BaseEntity(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
+    # 唯一鍵快取：欄位賦值時重新計算，複製時清除
+    _unique_key: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """建立後快取唯一鍵"""
+        self._unique_key = self._compute_unique_key()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._unique_key = self._compute_unique_key()
+
+    def __copy__(self: _EntityT) -> _EntityT:
+        # model_copy(update=...) 直接寫入 __dict__，不經過 __setattr__
+        copied = super().__copy__()
+        copied._unique_key = ""
+        return copied
+
+    def __deepcopy__(self: _EntityT, memo: Optional[Dict[int, Any]] = None) -> _EntityT:
+        copied = super().__deepcopy__(memo)
+        copied._unique_key = ""
+        return copied
+
+    def _compute_unique_key(self) -> str:
+        """生成唯一鍵，子類別覆寫以決定鍵的組成"""
+        return f"{self.entity_type}:{self.name}"
+
     @computed_field
     @property
     def unique_key(self) -> str:
-        """生成唯一鍵，用於去重和索引"""
-        return f"{self.entity_type}:{self.name}"
+        """唯一鍵，用於去重和索引"""
+        key = self._unique_key
+        if not key:
+            key = self._unique_key = self._compute_unique_key()
+        return key
 
     def __hash__(self) -> int:
         """支持哈希，用於集合操作"""
@@ -105,15 +159,15 @@ class File(BaseEntity):
             raise ValueError("File path cannot be empty")
         return v.strip()
 
-    @computed_field
-    @property
-    def unique_key(self) -> str:
+    def _compute_unique_key(self) -> str:
         """文件的唯一鍵基於路徑"""
         return f"File:{self.path}"
 
-    def calculate_hash(self, content: str) -> str:
-        """計算文件內容哈希"""
-        return hashlib.sha256(content.encode(self.encoding)).hexdigest()
+    def calculate_hash(self, content: Union[str, bytes]) -> str:
+        """計算文件內容哈希（傳入原始位元組時不需再編碼）"""
+        if isinstance(content, str):
+            content = content.encode(self.encoding)
+        return hashlib.sha256(content).hexdigest()
 
 
 class Function(BaseEntity):
@@ -158,9 +212,7 @@ class Function(BaseEntity):
             raise ValueError("End line must be greater than or equal to start line")
         return v
 
-    @computed_field
-    @property
-    def unique_key(self) -> str:
+    def _compute_unique_key(self) -> str:
         """函數的唯一鍵基於文件路徑和函數名"""
         return f"Function:{self.file_path}:{self.name}:{self.line_start}"
 
@@ -196,9 +248,7 @@ class Class(BaseEntity):
     method_count: Optional[int] = Field(default=None, description="方法數量")
     property_count: Optional[int] = Field(default=None, description="屬性數量")
 
-    @computed_field
-    @property
-    def unique_key(self) -> str:
+    def _compute_unique_key(self) -> str:
         """類的唯一鍵基於文件路徑和類名"""
         return f"Class:{self.file_path}:{self.name}"
 
@@ -221,9 +271,7 @@ class Package(BaseEntity):
     file_count: Optional[int] = Field(default=None, description="包含文件數量")
     subpackage_count: Optional[int] = Field(default=None, description="子包數量")
 
-    @computed_field
-    @property
-    def unique_key(self) -> str:
+    def _compute_unique_key(self) -> str:
         """包的唯一鍵基於路徑"""
         return f"Package:{self.path}"
 
@@ -248,8 +296,8 @@ class ThirdPartyPackage(BaseEntity):
     security_advisories: List[str] = Field(default_factory=list, description="安全公告")
     deprecated: bool = Field(default=False, description="是否已棄用")
 
-    @computed_field
-    @property
-    def unique_key(self) -> str:
+    model_config = ConfigDict(frozen=True)
+
+    def _compute_unique_key(self) -> str:
         """第三方包的唯一鍵基於名稱和版本"""
         return f"ThirdPartyPackage:{self.name}:{self.version}"
@@ -4,21 +4,25 @@ Pytest 配置和共享 fixtures
 提供測試所需的共享配置和 fixtures。
 """
 
-import asyncio
-from typing import AsyncGenerator, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
 
-# App import moved to test_client fixture to avoid lifespan issues
-from mnemosyne.core.config import Settings
 from mnemosyne.interfaces.graph_store import (
     ConnectionConfig,
     GraphStoreClient,
     QueryResult,
 )
 
+# FastAPI 與配置模組較重，僅在使用對應 fixture 時才載入
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from mnemosyne.core.config import Settings
+
 
 class MockGraphStoreClient(GraphStoreClient):
     """模擬圖資料庫客戶端，用於測試"""
@@ -58,18 +62,15 @@ class MockGraphStoreClient(GraphStoreClient):
         return self._connected
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """創建事件循環"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def test_settings() -> Settings:
     """測試配置"""
-    from mnemosyne.core.config import APISettings, DatabaseSettings, LoggingSettings
+    from mnemosyne.core.config import (
+        APISettings,
+        DatabaseSettings,
+        LoggingSettings,
+        Settings,
+    )
 
     return Settings(
         environment="testing",
@@ -81,7 +82,7 @@ def test_settings() -> Settings:
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def mock_graph_client(
     test_settings,
 ) -> AsyncGenerator[MockGraphStoreClient, None]:
@@ -97,7 +98,9 @@ async def mock_graph_client(
 def test_client(test_settings, mock_graph_client) -> TestClient:
     """測試客戶端 fixture"""
     from fastapi import FastAPI
+    from fastapi.testclient import TestClient
 
+    # App import 放在 fixture 內以避免 lifespan 問題
     from mnemosyne.api.main import (
         get_current_settings,
         get_graph_client,
@@ -19,11 +19,11 @@ class TestSprint3Demo:
         print(f"🔍 搜索查詢: '{query}'")
 
         # 模擬搜索執行
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         search_result = self._simulate_hybrid_search(query)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
 
-        search_time_ms = (end_time - start_time) * 1000
+        search_time_ms = (end_time - start_time) / 1e6
 
         # 驗證搜索結果
         assert len(search_result["relevant_nodes"]) > 0
@@ -44,11 +44,11 @@ class TestSprint3Demo:
         print(f"🔬 分析函數: '{function_name}'")
 
         # 模擬分析執行
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         impact_result = self._simulate_impact_analysis(function_name)
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
 
-        analysis_time_ms = (end_time - start_time) * 1000
+        analysis_time_ms = (end_time - start_time) / 1e6
 
         # 驗證分析結果
         assert impact_result["function_name"] == function_name
@@ -106,7 +106,7 @@ class TestSprint3Demo:
         # 測試多個並發請求
         print("🚀 測試並發性能...")
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # 模擬並發請求
         search_results = []
@@ -116,8 +116,8 @@ class TestSprint3Demo:
             search_results.append(self._simulate_hybrid_search(f"test query {i}"))
             impact_results.append(self._simulate_impact_analysis(f"test_function_{i}"))
 
-        end_time = time.time()
-        total_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        total_time_ms = (end_time - start_time) / 1e6
 
         print(f"   並發執行時間: {total_time_ms:.2f}ms")
         print(f"   搜索請求: {len(search_results)} 個成功")
@@ -132,9 +132,7 @@ class TestSprint3Demo:
         print("✅ Demo 4 完成：性能驗證成功")
 
     def _simulate_hybrid_search(self, query):
-        """模擬混合搜索"""
-        time.sleep(0.08)  # 模擬 80ms 搜索時間
-
+        """模擬混合搜索（time_ms 為模擬的 80ms 搜索時間）"""
         return {
             "relevant_nodes": [
                 {"node_id": "func1", "type": "Function", "name": "login"},
@@ -147,9 +145,7 @@ class TestSprint3Demo:
         }
 
     def _simulate_impact_analysis(self, function_name):
-        """模擬影響力分析"""
-        time.sleep(0.07)  # 模擬 70ms 分析時間
-
+        """模擬影響力分析（time_ms 為模擬的 70ms 分析時間）"""
         callers_count = 5
         dependencies_count = 3
         risk_score = 0.4
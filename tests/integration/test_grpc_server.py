@@ -4,8 +4,6 @@ gRPC 伺服器整合測試
 測試 gRPC 伺服器的完整啟動和基本功能。
 """
 
-import asyncio
-
 import grpc
 import pytest
 
@@ -14,6 +12,23 @@ from mnemosyne.grpc import atlassian_pb2, atlassian_pb2_grpc
 from mnemosyne.grpc.server import AtlassianGrpcServer
 
 
+@pytest.fixture(scope="module")
+def grpc_channel():
+    """依端口快取 gRPC 通道，模組結束時統一關閉（測試失敗時也會關閉）"""
+    channels = {}
+
+    def get_channel(port: int) -> grpc.Channel:
+        channel = channels.get(port)
+        if channel is None:
+            channel = channels[port] = grpc.insecure_channel(f"localhost:{port}")
+        return channel
+
+    yield get_channel
+
+    for channel in channels.values():
+        channel.close()
+
+
 class TestAtlassianGrpcServer:
     """測試 AtlassianGrpcServer"""
 
@@ -45,7 +60,7 @@ class TestAtlassianGrpcServer:
         assert server.service is None
 
     @pytest.mark.asyncio
-    async def test_server_start_stop(self, settings):
+    async def test_server_start_stop(self, settings, grpc_channel):
         """測試伺服器啟動和停止"""
         server = AtlassianGrpcServer(settings, port=50053)
 
@@ -56,12 +71,10 @@ class TestAtlassianGrpcServer:
             assert server.server is not None
             assert server.service is not None
 
-            # 給伺服器一些時間來啟動
-            await asyncio.sleep(0.1)
-
-            # 測試基本的 gRPC 連接
-            channel = grpc.insecure_channel("localhost:50053")
-            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(channel)
+            # 伺服器在 start() 返回時已綁定端口，直接使用 gRPC 連接
+            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(
+                grpc_channel(50053)
+            )
 
             # 測試健康檢查
             request = atlassian_pb2.HealthCheckRequest(check_connectivity=False)
@@ -70,15 +83,12 @@ class TestAtlassianGrpcServer:
             assert response.status == atlassian_pb2.HealthCheckResponse.Status.HEALTHY
             assert response.message == "Service is running"
 
-            # 關閉通道
-            channel.close()
-
         finally:
             # 停止伺服器
             await server.stop()
 
     @pytest.mark.asyncio
-    async def test_server_grpc_stats(self, settings):
+    async def test_server_grpc_stats(self, settings, grpc_channel):
         """測試伺服器 gRPC 統計端點"""
         server = AtlassianGrpcServer(settings, port=50054)
 
@@ -86,12 +96,10 @@ class TestAtlassianGrpcServer:
         await server.start()
 
         try:
-            # 給伺服器一些時間來啟動
-            await asyncio.sleep(0.1)
-
-            # 測試基本的 gRPC 連接
-            channel = grpc.insecure_channel("localhost:50054")
-            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(channel)
+            # 伺服器在 start() 返回時已綁定端口，直接使用 gRPC 連接
+            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(
+                grpc_channel(50054)
+            )
 
             # 測試統計端點
             request = atlassian_pb2.GetExtractionStatsRequest()
@@ -102,15 +110,12 @@ class TestAtlassianGrpcServer:
             assert response.failed_requests == 0
             assert response.success_rate == 0.0
 
-            # 關閉通道
-            channel.close()
-
         finally:
             # 停止伺服器
             await server.stop()
 
     @pytest.mark.asyncio
-    async def test_server_unconfigured_service(self):
+    async def test_server_unconfigured_service(self, grpc_channel):
         """測試未配置的服務"""
         # 創建未配置的設定
         unconfigured_settings = Settings(mcp_atlassian=MCPAtlassianSettings())
@@ -121,12 +126,10 @@ class TestAtlassianGrpcServer:
         await server.start()
 
         try:
-            # 給伺服器一些時間來啟動
-            await asyncio.sleep(0.1)
-
-            # 測試基本的 gRPC 連接
-            channel = grpc.insecure_channel("localhost:50055")
-            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(channel)
+            # 伺服器在 start() 返回時已綁定端口，直接使用 gRPC 連接
+            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(
+                grpc_channel(50055)
+            )
 
             # 測試健康檢查應該顯示不健康
             request = atlassian_pb2.HealthCheckRequest(check_connectivity=False)
@@ -135,15 +138,12 @@ class TestAtlassianGrpcServer:
             assert response.status == atlassian_pb2.HealthCheckResponse.Status.UNHEALTHY
             assert "not configured" in response.message
 
-            # 關閉通道
-            channel.close()
-
         finally:
             # 停止伺服器
             await server.stop()
 
     @pytest.mark.asyncio
-    async def test_server_jira_extraction_unconfigured(self):
+    async def test_server_jira_extraction_unconfigured(self, grpc_channel):
         """測試未配置時的 Jira 提取"""
         # 創建未配置的設定
         unconfigured_settings = Settings(mcp_atlassian=MCPAtlassianSettings())
@@ -154,12 +154,10 @@ class TestAtlassianGrpcServer:
         await server.start()
 
         try:
-            # 給伺服器一些時間來啟動
-            await asyncio.sleep(0.1)
-
-            # 測試基本的 gRPC 連接
-            channel = grpc.insecure_channel("localhost:50056")
-            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(channel)
+            # 伺服器在 start() 返回時已綁定端口，直接使用 gRPC 連接
+            stub = atlassian_pb2_grpc.AtlassianKnowledgeExtractorStub(
+                grpc_channel(50056)
+            )
 
             # 測試 Jira 提取應該返回錯誤
             request = atlassian_pb2.ExtractJiraIssuesRequest(query="test")
@@ -172,9 +170,6 @@ class TestAtlassianGrpcServer:
                 # 或者返回 gRPC 錯誤
                 assert e.code() == grpc.StatusCode.UNAVAILABLE
 
-            # 關閉通道
-            channel.close()
-
         finally:
             # 停止伺服器
             await server.stop()
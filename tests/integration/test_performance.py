@@ -4,8 +4,6 @@
 驗證 Sprint 3 功能滿足 < 500ms SLA 要求。
 """
 
-import time
-
 
 class TestPerformance:
     """性能測試類別"""
@@ -21,13 +19,8 @@ class TestPerformance:
         ]
 
         for query in test_queries:
-            start_time = time.time()
-
             # 模擬搜索操作
-            self._simulate_search_operation(query)
-
-            end_time = time.time()
-            execution_time_ms = (end_time - start_time) * 1000
+            execution_time_ms = self._simulate_search_operation(query)
 
             # 驗證 SLA
             assert (
@@ -45,13 +38,8 @@ class TestPerformance:
         ]
 
         for function_name in test_functions:
-            start_time = time.time()
-
             # 模擬影響力分析操作
-            self._simulate_impact_analysis(function_name)
-
-            end_time = time.time()
-            execution_time_ms = (end_time - start_time) * 1000
+            execution_time_ms = self._simulate_impact_analysis(function_name)
 
             # 驗證 SLA
             assert (
@@ -69,13 +57,8 @@ class TestPerformance:
         ]
 
         for seed_nodes in seed_node_sets:
-            start_time = time.time()
-
             # 模擬圖遍歷操作
-            self._simulate_graph_traversal(seed_nodes)
-
-            end_time = time.time()
-            execution_time_ms = (end_time - start_time) * 1000
+            execution_time_ms = self._simulate_graph_traversal(seed_nodes)
 
             # 驗證 SLA
             assert (
@@ -84,17 +67,10 @@ class TestPerformance:
 
     def test_concurrent_requests_performance(self):
         """測試並發請求性能"""
-        start_time = time.time()
-
-        # 模擬並發請求（順序執行但驗證總時間）
-        for i in range(5):
-            self._simulate_search_operation(f"query_{i}")
-
-        for i in range(3):
-            self._simulate_impact_analysis(f"function_{i}")
-
-        end_time = time.time()
-        total_time_ms = (end_time - start_time) * 1000
+        # 模擬並發請求（以順序執行的模擬耗時總和作為上限驗證）
+        total_time_ms = sum(
+            self._simulate_search_operation(f"query_{i}") for i in range(5)
+        ) + sum(self._simulate_impact_analysis(f"function_{i}") for i in range(3))
 
         # 並發執行應該在合理時間內完成
         assert (
@@ -102,36 +78,19 @@ class TestPerformance:
         ), f"Concurrent execution took {total_time_ms:.2f}ms, too slow"
 
     def _simulate_search_operation(self, query):
-        """模擬搜索操作"""
-        # 模擬向量搜索
-        time.sleep(0.02)  # 20ms
-
-        # 模擬圖遍歷
-        time.sleep(0.03)  # 30ms
-
-        # 模擬結果合併
-        time.sleep(0.01)  # 10ms
-
-        # 總計約 60ms
+        """模擬搜索操作，返回模擬耗時（毫秒）"""
+        # 向量搜索 20ms + 圖遍歷 30ms + 結果合併 10ms
+        return 20.0 + 30.0 + 10.0
 
     def _simulate_impact_analysis(self, function_name):
-        """模擬影響力分析操作"""
-        # 模擬查找呼叫者
-        time.sleep(0.025)  # 25ms
-
-        # 模擬查找依賴
-        time.sleep(0.025)  # 25ms
-
-        # 模擬風險計算
-        time.sleep(0.01)  # 10ms
-
-        # 總計約 60ms
+        """模擬影響力分析操作，返回模擬耗時（毫秒）"""
+        # 查找呼叫者 25ms + 查找依賴 25ms + 風險計算 10ms
+        return 25.0 + 25.0 + 10.0
 
     def _simulate_graph_traversal(self, seed_nodes):
-        """模擬圖遍歷操作"""
-        # 模擬 1-hop 遍歷
-        traversal_time = len(seed_nodes) * 0.01  # 每個種子節點 10ms
-        time.sleep(traversal_time)
+        """模擬 1-hop 圖遍歷操作，返回模擬耗時（毫秒）"""
+        # 每個種子節點 10ms
+        return len(seed_nodes) * 10.0
 
     def test_memory_usage_stability(self):
         """測試記憶體使用穩定性"""
@@ -151,28 +110,23 @@ class TestPerformance:
     def test_error_recovery_performance(self):
         """測試錯誤恢復性能"""
         success_count = 0
-        total_time = 0
+        total_time = 0.0
 
         # 模擬一些成功和失敗的操作
         for i in range(10):
-            start_time = time.time()
-
             try:
                 if i % 3 == 0:  # 每第三次模擬失敗
                     raise Exception("Simulated error")
                 else:
-                    self._simulate_search_operation(f"error test {i}")
+                    total_time += self._simulate_search_operation(f"error test {i}")
                     success_count += 1
 
-                end_time = time.time()
-                total_time += end_time - start_time
-
             except Exception:
                 pass  # 預期的錯誤
 
         # 驗證成功的請求仍然滿足性能要求
         if success_count > 0:
-            avg_time_ms = (total_time / success_count) * 1000
+            avg_time_ms = total_time / success_count
             assert (
                 avg_time_ms < 500
             ), f"Average successful request time {avg_time_ms:.2f}ms exceeds SLA"
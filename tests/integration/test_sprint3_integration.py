@@ -15,11 +15,11 @@ class TestSprint3Integration:
 
         # 模擬性能測試
         def simulate_search_performance():
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             # 模擬搜索操作
             time.sleep(0.1)  # 模擬 100ms 操作
-            end_time = time.time()
-            return (end_time - start_time) * 1000  # 轉換為毫秒
+            end_time = time.perf_counter_ns()
+            return (end_time - start_time) / 1e6  # 轉換為毫秒
 
         # 執行性能測試
         search_time = simulate_search_performance()
@@ -6,9 +6,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.mnemosyne.ecl.atlassian_loader import AtlassianGraphLoader, AtlassianLoadResult
-from src.mnemosyne.schemas.atlassian import AtlassianEntity, AtlassianRelationship
-from src.mnemosyne.schemas.relationships import RelationshipType
+from mnemosyne.ecl.atlassian_loader import AtlassianGraphLoader, AtlassianLoadResult
+from mnemosyne.schemas.atlassian import AtlassianEntity, AtlassianRelationship
+from mnemosyne.schemas.relationships import RelationshipType
 
 
 class TestAtlassianGraphLoader:
@@ -60,3 +60,30 @@ class TestAtlassianMapperSimple:
         assert relationship.source_id == entity.id
         assert relationship.target_id == "jira_project_DEMO"
         assert relationship.extra["project_name"] == "DEMO"
+
+    def test_batch_map_jira_issues(self):
+        """測試批次映射 Jira Issues 與專案關係"""
+        issues = [
+            JiraIssue(id="1", key="DEMO-1", summary="A", status="Open", project="DEMO"),
+            JiraIssue(id="2", key="DEMO-2", summary="B", status="Done"),
+        ]
+
+        entities, relationships = AtlassianMapper.batch_map_jira_issues(issues)
+
+        assert [e.id for e in entities] == ["jira_issue_DEMO-1", "jira_issue_DEMO-2"]
+        assert len(relationships) == 1
+        assert relationships[0].target_id == "jira_project_DEMO"
+
+    def test_batch_map_jira_issues_skips_invalid_items(self):
+        """測試批次映射遇到無效資料時退回逐筆處理"""
+        valid = JiraIssue(id="1", key="DEMO-1", summary="A", status="Open")
+        invalid = JiraIssue.model_construct(
+            id="2", key="DEMO-2", summary=None, status="Open"
+        )
+
+        entities, relationships = AtlassianMapper.batch_map_jira_issues(
+            [valid, invalid]
+        )
+
+        assert [e.id for e in entities] == ["jira_issue_DEMO-1"]
+        assert relationships == []
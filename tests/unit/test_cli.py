@@ -57,3 +57,50 @@ def test_cli_dependencies_import():
         assert setup_logging is not None
     except ImportError as e:
         pytest.fail(f"CLI 依賴導入失敗: {e}")
+
+
+def test_governance_json_output_is_equivalent(monkeypatch):
+    """測試治理 JSON 輸出不論是否使用 orjson 皆為等價的 JSON"""
+    import json
+
+    from mnemosyne.cli import governance
+    from mnemosyne.governance.models import (
+        Severity,
+        ValidationResult,
+        Violation,
+        ViolationLocation,
+    )
+
+    result = ValidationResult(success=False, total_files_checked=1)
+    result.add_violation(
+        Violation(
+            id="sec_001_app.py_3",
+            constraint_id="sec_001",
+            constraint_name="禁止使用危險函數",
+            message="安全風險: 使用了危險函數 eval",
+            severity=Severity.ERROR,
+            location=ViolationLocation(file_path="app.py", line_number=3),
+        )
+    )
+    # json 輸出 1e-05，orjson 輸出 0.00001
+    result.execution_time_ms = 1e-05
+    formatter = governance.OutputFormatter("json")
+
+    output = formatter.format_validation_result(result)
+    monkeypatch.setattr(governance, "_HAS_ORJSON", False)
+
+    # 兩種編碼器的浮點數格式可能不同，比較解析後的物件
+    assert json.loads(formatter.format_validation_result(result)) == json.loads(output)
+    assert json.loads(output)["violations"][0]["severity"] == "error"
+
+
+def test_governance_run_sync_reuses_event_loop():
+    """測試重複執行 PR 檢查時共用同一個事件迴圈"""
+    from mnemosyne.cli import governance
+
+    first = governance.GovernanceCLI().run_sync(format_type="json")
+    loop = governance._loop
+    second = governance.GovernanceCLI().run_sync(format_type="json")
+
+    assert first == second == 1
+    assert governance._loop is loop
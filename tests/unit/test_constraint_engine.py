@@ -0,0 +1,160 @@
+"""
+約束引擎測試
+
+測試 ConstraintEngine 的規則檢查與結果彙整。
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from mnemosyne.governance.constraint_engine import ConstraintEngine, SecurityRule
+from mnemosyne.governance.models import (
+    Constraint,
+    ConstraintType,
+    RuleConfig,
+    Severity,
+)
+
+
+def _make_constraint(constraint_type: ConstraintType, severity: Severity) -> Constraint:
+    return Constraint(
+        id=f"{constraint_type.value}_rule",
+        name=f"{constraint_type.value} rule",
+        description="測試約束",
+        type=constraint_type,
+        severity=severity,
+        rule_config=RuleConfig(),
+    )
+
+
+@pytest.mark.unit
+class TestConstraintEngine:
+    """測試約束引擎"""
+
+    def test_rule_check_is_synchronous(self):
+        """測試規則檢查直接返回違規列表"""
+        rule = SecurityRule(_make_constraint(ConstraintType.SECURITY, Severity.ERROR))
+
+        violations = rule.check(
+            "app.py", {"function_calls": [{"name": "eval", "line_number": 7}]}
+        )
+
+        assert len(violations) == 1
+        assert violations[0].location.line_number == 7
+
+        with pytest.raises(ValidationError):
+            violations[0].location.line_number = 8
+
+    def test_security_rule_accepts_extra_dangerous_functions(self):
+        """測試規則配置可追加危險函數名稱"""
+        constraint = _make_constraint(ConstraintType.SECURITY, Severity.ERROR)
+        constraint.rule_config = RuleConfig(dangerous_functions=["__import__"])
+        rule = SecurityRule(constraint)
+
+        violations = rule.check(
+            "app.py", {"function_calls": [{"name": "__import__"}, {"name": "eval"}]}
+        )
+
+        assert len(violations) == 2
+
+    def test_security_rule_reads_rule_config_on_each_check(self):
+        """測試規則建立後修改配置，下次檢查即生效"""
+        constraint = _make_constraint(ConstraintType.SECURITY, Severity.ERROR)
+        rule = SecurityRule(constraint)
+        ast_data = {"function_calls": [{"name": "__import__"}]}
+        assert rule.check("app.py", ast_data) == []
+
+        constraint.rule_config.dangerous_functions = ["__import__"]
+
+        assert len(rule.check("app.py", ast_data)) == 1
+
+    @pytest.mark.asyncio
+    async def test_validate_file_collects_violations(self):
+        """測試驗證檔案時彙整所有規則的違規"""
+        engine = ConstraintEngine()
+        engine.add_constraint(
+            _make_constraint(ConstraintType.ARCHITECTURE, Severity.WARNING)
+        )
+        engine.add_constraint(_make_constraint(ConstraintType.SECURITY, Severity.ERROR))
+
+        result = await engine.validate_file(
+            "ui/view.py",
+            {
+                "imports": [{"module": "app.database", "line_number": 1}],
+                "function_calls": [{"name": "exec", "line_number": 4}],
+            },
+        )
+
+        assert result.total_violations == 2
+        assert result.warning_count == 1
+        assert result.error_count == 1
+        assert not result.success
+
+    @pytest.mark.asyncio
+    async def test_validate_file_skips_unknown_rule_type(self):
+        """測試未註冊的約束類型不影響其他規則"""
+        engine = ConstraintEngine()
+        engine.add_constraint(_make_constraint(ConstraintType.NAMING, Severity.ERROR))
+
+        result = await engine.validate_file("app.py", {})
+
+        assert result.success
+        assert result.total_violations == 0
+
+    @pytest.mark.asyncio
+    async def test_rules_are_reused_until_constraint_replaced(self):
+        """測試規則實例跨檔案重複使用，替換約束後重新建立"""
+        engine = ConstraintEngine()
+        constraint = _make_constraint(ConstraintType.SECURITY, Severity.ERROR)
+        engine.add_constraint(constraint)
+
+        await engine.validate_file("a.py", {})
+        rule = engine._rule_cache[constraint.id][1]
+        await engine.validate_file("b.py", {})
+        assert engine._rule_cache[constraint.id][1] is rule
+
+        engine.add_constraint(constraint.model_copy(update={"name": "renamed"}))
+        assert constraint.id not in engine._rule_cache
+
+    @pytest.mark.asyncio
+    async def test_rule_config_changes_apply_to_later_validations(self):
+        """測試兩次驗證之間修改約束配置，後續驗證反映新配置"""
+        engine = ConstraintEngine()
+        constraint = _make_constraint(ConstraintType.SECURITY, Severity.ERROR)
+        engine.add_constraint(constraint)
+        files = {"a.py": {"function_calls": [{"name": "__import__"}]}}
+
+        first = await engine.validate_files(files)
+        constraint.rule_config = RuleConfig(dangerous_functions=["__import__"])
+        constraint.severity = Severity.WARNING
+        second = await engine.validate_files(files)
+
+        assert first.total_violations == 0
+        assert second.total_violations == 1
+        assert second.warning_count == 1
+        assert engine._rule_cache[constraint.id][1].rule_config is (
+            constraint.rule_config
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_files_aggregates_results(self):
+        """測試批次驗證多個檔案時彙整成單一結果"""
+        engine = ConstraintEngine()
+        engine.add_constraint(_make_constraint(ConstraintType.SECURITY, Severity.ERROR))
+        engine.add_constraint(
+            _make_constraint(ConstraintType.ARCHITECTURE, Severity.WARNING)
+        )
+
+        result = await engine.validate_files(
+            {
+                "ui/form.py": {"imports": [{"module": "database.repo"}]},
+                "a.py": {"function_calls": [{"name": "eval"}]},
+                "b.py": {"function_calls": [{"name": "exec"}, {"name": "print"}]},
+            }
+        )
+
+        assert result.total_files_checked == 3
+        assert result.total_violations == 3
+        assert result.error_count == 2
+        assert result.warning_count == 1
+        assert not result.success
@@ -4,12 +4,16 @@ FalkorDB 驅動測試
 測試 FalkorDBDriver 的基本功能。
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from mnemosyne.drivers.falkordb_driver import FalkorDBDriver
-from mnemosyne.interfaces.graph_store import ConnectionConfig, ConnectionError
+from mnemosyne.interfaces.graph_store import (
+    ConnectionConfig,
+    ConnectionError,
+    QueryResult,
+)
 
 
 @pytest.mark.unit
@@ -205,3 +209,47 @@ class TestFalkorDBDriver:
         assert health["port"] == 6379
         assert "response_time_ms" in health
         assert "timestamp" in health
+        assert health["test_query_success"] is True
+
+        # 連線測試一次 + 健康檢查單次往返
+        assert mock_graph.query.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("label", "should_pass"),
+        [
+            ("Code_Chunk-1", True),
+            ("CodeChunk", True),
+            ("", False),
+            ("Code Chunk", False),
+            ("Code') DETACH DELETE n //", False),
+            ("Code`Chunk", False),
+        ],
+    )
+    async def test_create_vector_index_label_validation(self, label, should_pass):
+        """測試向量索引僅接受英數字、底線與連字號組成的標籤"""
+        config = ConnectionConfig(host="localhost", port=6379, database="test")
+        driver = FalkorDBDriver(config)
+        driver.execute_query = AsyncMock()
+
+        assert await driver.create_vector_index(label, "embedding") is should_pass
+        assert driver.execute_query.await_count == int(should_pass)
+
+
+@pytest.mark.unit
+class TestQueryResult:
+    """測試 QueryResult"""
+
+    def test_count_follows_data_changes(self):
+        """測試建立後修改 data，count 與 is_empty 隨之更新"""
+        result = QueryResult(data=[], execution_time_ms=0.0, query="RETURN 1")
+        assert result.is_empty
+        assert result.count == 0
+
+        result.data.append({"n": 1})
+        assert not result.is_empty
+        assert result.count == 1
+
+        result.data.clear()
+        assert result.is_empty
+        assert result.count == 0
@@ -0,0 +1,51 @@
+"""
+LLM 基礎模型測試
+
+測試 EmbeddingResponse 的 float32 向量表示與快取。
+"""
+
+import pytest
+
+from mnemosyne.llm.base import EmbeddingResponse
+
+
+@pytest.mark.unit
+class TestEmbeddingResponse:
+    """測試 EmbeddingResponse"""
+
+    def test_vector_is_float32_array(self):
+        """測試 vector 以 float32 陣列表示嵌入"""
+        response = EmbeddingResponse(embedding=[0.1, 0.2, 0.3], dimension=3)
+
+        vector = response.vector
+
+        assert vector.typecode == "f"
+        assert vector.itemsize == 4
+        assert list(vector) == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
+
+    def test_vector_is_cached(self):
+        """測試重複存取返回同一個快取陣列"""
+        response = EmbeddingResponse(embedding=[1.0, 2.0], dimension=2)
+
+        assert response.vector is response.vector
+
+    def test_vector_follows_embedding_assignment(self):
+        """測試重新指定 embedding 後向量隨之更新"""
+        response = EmbeddingResponse(embedding=[1.0, 2.0], dimension=2)
+        assert list(response.vector) == [1.0, 2.0]
+
+        response.embedding = [3.0, 4.0]
+
+        assert list(response.vector) == [3.0, 4.0]
+
+    def test_vector_follows_model_copy_update(self):
+        """測試 model_copy(update=...) 後向量反映新的 embedding"""
+        response = EmbeddingResponse(embedding=[1.0, 2.0], dimension=2)
+        original = response.vector
+
+        for deep in (False, True):
+            copied = response.model_copy(update={"embedding": [5.0, 6.0]}, deep=deep)
+
+            assert list(copied.vector) == [5.0, 6.0]
+            assert copied.vector is not original
+        assert list(response.vector) == [1.0, 2.0]
@@ -0,0 +1,271 @@
+"""
+MCP Adapter 測試
+
+測試工具回應快取、相同搜尋的單次派送，以及 GrpcBridge 的搜尋快取。
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mnemosyne.grpc.generated import mcp_pb2
+from mnemosyne.mcp_adapter.grpc_bridge import GrpcBridge
+from mnemosyne.mcp_adapter.tools import register_tools
+from mnemosyne.mcp_adapter.utils import (
+    MAX_DISPLAY_RESULTS,
+    TTLCache,
+    format_search_results,
+)
+
+
+class _ToolRecorder:
+    """記錄 register_tools 註冊的工具函數，取代 FastMCP"""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(func):
+            self.tools[func.__name__] = func
+            return func
+
+        return decorator
+
+
+class _FakeBridge:
+    """可控制回應時機的假橋接器"""
+
+    def __init__(self):
+        self.search_cache = TTLCache(maxsize=8, ttl=30.0)
+        self.search_calls = 0
+        self.search_limits = []
+        self.search_results = ()
+        self.impact_calls = 0
+        self.release = asyncio.Event()
+        self.impact_result = {"summary": "ok", "risk_level": "LOW", "impact_nodes": 1}
+
+    async def search_code(self, query, limit):
+        self.search_calls += 1
+        self.search_limits.append(limit)
+        await self.release.wait()
+        results = self.search_results[:limit]
+        return {"summary": "完成", "results": results, "total": len(results)}
+
+    async def analyze_impact(self, project_id, pr_number=""):
+        self.impact_calls += 1
+        return self.impact_result
+
+
+def _register(bridge):
+    recorder = _ToolRecorder()
+    register_tools(recorder, bridge)
+    return recorder.tools
+
+
+def _hits(count):
+    return tuple((f"n{i}", "Function", "content", 0.9) for i in range(count))
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """測試 TTLCache"""
+
+    def test_entries_expire_after_ttl(self):
+        """測試超過存活時間的項目視為未命中"""
+        cache = TTLCache(maxsize=4, ttl=10.0)
+
+        with patch("mnemosyne.mcp_adapter.utils.time.monotonic", return_value=100.0):
+            cache.set("k", "v")
+            assert cache.get("k") == "v"
+
+        with patch("mnemosyne.mcp_adapter.utils.time.monotonic", return_value=110.0):
+            assert cache.get("k") is None
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """測試超過容量時淘汰最久未使用的項目"""
+        cache = TTLCache(maxsize=2, ttl=30.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+@pytest.mark.unit
+class TestSearchCodeTool:
+    """測試 search_code 工具的單次派送"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_call(self):
+        """測試相同查詢同時到達時只呼叫一次橋接器"""
+        bridge = _FakeBridge()
+        search_code = _register(bridge)["search_code"]
+
+        waiters = [asyncio.ensure_future(search_code("auth", 3)) for _ in range(3)]
+        await asyncio.sleep(0)
+        bridge.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert bridge.search_calls == 1
+        assert len(set(results)) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_search(self):
+        """測試單一呼叫者被取消時其他等待者仍取得結果"""
+        bridge = _FakeBridge()
+        search_code = _register(bridge)["search_code"]
+
+        first = asyncio.ensure_future(search_code("auth", 3))
+        second = asyncio.ensure_future(search_code("auth", 3))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        bridge.release.set()
+
+        assert "摘要: 完成" in await second
+        assert first.cancelled()
+        assert bridge.search_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_search_is_not_shared_with_later_calls(self):
+        """測試搜尋完成後移除進行中的任務，後續呼叫重新派送"""
+        bridge = _FakeBridge()
+        bridge.release.set()
+        search_code = _register(bridge)["search_code"]
+
+        await search_code("auth", 3)
+        await search_code("auth", 3)
+
+        assert bridge.search_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_capped_limit_reports_possible_more_results(self):
+        """測試請求數量超過顯示上限時只請求上限數量，並提示可能還有更多結果"""
+        bridge = _FakeBridge()
+        bridge.release.set()
+        bridge.search_results = _hits(MAX_DISPLAY_RESULTS + 3)
+        search_code = _register(bridge)["search_code"]
+
+        capped = await search_code("auth", 15)
+        exact = await search_code("auth", MAX_DISPLAY_RESULTS)
+
+        assert bridge.search_limits == [MAX_DISPLAY_RESULTS, MAX_DISPLAY_RESULTS]
+        assert "可能還有更多結果未顯示" in capped
+        assert "可能還有更多結果未顯示" not in exact
+
+
+@pytest.mark.unit
+class TestFormatSearchResults:
+    """測試搜尋結果格式化"""
+
+    def test_long_content_is_truncated_with_ascii_ellipsis(self):
+        """測試過長內容截斷後以 ... 結尾"""
+        text = format_search_results(
+            [("n1", "Function", "x" * 500, 0.5)], total=1, summary="s"
+        )
+
+        assert "x" * 200 + "...\n" in text + "\n"
+        assert "x" * 201 not in text
+
+    def test_hint_only_when_capped_and_page_is_full(self):
+        """測試僅在請求數量被截斷且結果已滿時顯示提示"""
+        full = _hits(MAX_DISPLAY_RESULTS)
+        partial = _hits(MAX_DISPLAY_RESULTS - 1)
+
+        assert "💡 提示" in format_search_results(
+            full, len(full), "s", limit_capped=True
+        )
+        assert "💡 提示" not in format_search_results(full, len(full), "s")
+        assert "💡 提示" not in format_search_results(
+            partial, len(partial), "s", limit_capped=True
+        )
+
+
+@pytest.mark.unit
+class TestAnalyzeImpactTool:
+    """測試 analyze_impact 工具的回應快取"""
+
+    @pytest.mark.asyncio
+    async def test_successful_result_is_cached(self):
+        """測試成功的分析結果在存活時間內重複使用"""
+        bridge = _FakeBridge()
+        analyze_impact = _register(bridge)["analyze_impact"]
+
+        first = await analyze_impact("proj", "1")
+        second = await analyze_impact("proj", "1")
+
+        assert first == second
+        assert bridge.impact_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_error_result_is_not_cached(self):
+        """測試錯誤結果不寫入快取"""
+        bridge = _FakeBridge()
+        bridge.impact_result = {"summary": "失敗", "error": "gRPC Error: UNAVAILABLE"}
+        analyze_impact = _register(bridge)["analyze_impact"]
+
+        await analyze_impact("proj", "1")
+        await analyze_impact("proj", "1")
+
+        assert bridge.impact_calls == 2
+
+
+@pytest.mark.unit
+class TestGrpcBridgeSearchCache:
+    """測試 GrpcBridge 的搜尋快取"""
+
+    def _make_bridge(self, test_settings, side_effect):
+        bridge = GrpcBridge(test_settings)
+        bridge._is_connected = True
+        bridge.stub = Mock()
+        bridge.stub.Search = AsyncMock(side_effect=side_effect)
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_read_only_result(self, test_settings):
+        """測試快取命中返回唯讀結果，且不計入成功請求數"""
+        response = mcp_pb2.SearchResponse(
+            summary="s",
+            relevant_nodes=[
+                mcp_pb2.SearchResult(node_id="n1", node_type="Function", content="c")
+            ],
+        )
+        bridge = self._make_bridge(test_settings, [response])
+
+        first = await bridge.search_code("q", 5)
+        second = await bridge.search_code("q", 5)
+
+        assert second is first
+        assert isinstance(first["results"], tuple)
+        with pytest.raises(TypeError):
+            first["total"] = 0  # type: ignore[index]
+
+        stats = bridge.get_stats()
+        assert stats["total_requests"] == 1
+        assert stats["successful_requests"] == 1
+        assert stats["cache_hits"] == 1
+        assert bridge.stub.Search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_error_result_is_not_cached(self, test_settings):
+        """測試搜尋失敗時不寫入快取，下次呼叫重新請求"""
+        bridge = self._make_bridge(
+            test_settings, [RuntimeError("boom"), mcp_pb2.SearchResponse(summary="s")]
+        )
+
+        failed = await bridge.search_code("q", 5)
+        recovered = await bridge.search_code("q", 5)
+
+        assert "error" in failed
+        assert "error" not in recovered
+        assert bridge.stub.Search.await_count == 2
+        assert bridge.get_stats()["failed_requests"] == 1
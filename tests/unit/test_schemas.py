@@ -4,14 +4,29 @@
 測試 Pydantic 數據模型的驗證和序列化。
 """
 
-from datetime import datetime
+import os
+import uuid
+from datetime import datetime, timedelta
 
 import pytest
 from pydantic import ValidationError
 
-from mnemosyne.schemas.constraints import Constraint, ConstraintSeverity, ConstraintType
-from mnemosyne.schemas.core import EntityType, File, Function
-from mnemosyne.schemas.relationships import CallsRelationship, RelationshipType
+from mnemosyne.schemas.api import AnalyzeImpactArgs, HealthResponse, SearchCodeArgs
+from mnemosyne.schemas.atlassian import AtlassianEntity
+from mnemosyne.schemas.constraints import (
+    Constraint,
+    ConstraintSeverity,
+    ConstraintType,
+    Lock,
+)
+from mnemosyne.schemas.core import EntityType, File, Function, uuid4_str
+from mnemosyne.schemas.relationships import (
+    CallsRelationship,
+    ImportsRelationship,
+    RelationshipType,
+    _reset_relationship_ids,
+    next_relationship_id,
+)
 
 
 @pytest.mark.unit
@@ -31,12 +46,48 @@ class TestFileEntity:
         assert file_entity.entity_type == EntityType.FILE
         assert file_entity.unique_key == "File:/app/main.py"
 
+    def test_unique_key_follows_field_assignment(self):
+        """測試欄位重新賦值後唯一鍵與相等比較隨之更新"""
+        file_entity = File(name="b.py", path="a/b.py", extension=".py")
+        other = File(name="b.py", path="a/b.py", extension=".py")
+        assert file_entity == other
+
+        file_entity.path = "c/d.py"
+
+        assert file_entity.unique_key == "File:c/d.py"
+        assert file_entity.model_dump()["unique_key"] == "File:c/d.py"
+        assert file_entity != other
+        assert len({file_entity, other}) == 2
+
+    def test_unique_key_follows_model_copy_update(self):
+        """測試 model_copy(update=...) 產生的副本使用新的唯一鍵"""
+        file_entity = File(name="b.py", path="a/b.py", extension=".py")
+
+        for deep in (False, True):
+            copied = file_entity.model_copy(update={"path": "c/d.py"}, deep=deep)
+
+            assert copied.unique_key == "File:c/d.py"
+            assert copied.model_dump()["unique_key"] == "File:c/d.py"
+            assert copied != file_entity
+
+        assert file_entity.unique_key == "File:a/b.py"
+
     def test_file_extension_normalization(self):
         """測試文件擴展名標準化"""
         file_entity = File(name="test.py", path="/test.py", extension="py")  # 沒有點
 
         assert file_entity.extension == ".py"
 
+    def test_default_id_is_uuid4(self):
+        """測試預設 ID 為標準格式的 UUID4"""
+        file_entity = File(name="test.py", path="/test.py", extension=".py")
+
+        parsed = uuid.UUID(file_entity.id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == file_entity.id
+        assert uuid4_str() != uuid4_str()
+
     def test_file_path_validation(self):
         """測試文件路徑驗證"""
         with pytest.raises(ValidationError):
@@ -51,6 +102,7 @@ class TestFileEntity:
 
         assert isinstance(hash_value, str)
         assert len(hash_value) == 64  # SHA256 哈希長度
+        assert file_entity.calculate_hash(content.encode("utf-8")) == hash_value
 
 
 @pytest.mark.unit
@@ -135,6 +187,22 @@ class TestCallsRelationship:
         assert relationship.is_conditional is True
         assert relationship.relationship_type == RelationshipType.CALLS
 
+    def test_default_ids_are_unique_per_process(self):
+        """測試預設關係 ID 帶有行程前綴且不重複"""
+        first = CallsRelationship(source_id="func_001", target_id="func_002")
+        second = CallsRelationship(source_id="func_001", target_id="func_002")
+
+        assert first.id != second.id
+        assert first.id.startswith(f"{os.getpid():x}-")
+
+    def test_id_prefix_differs_between_processes_with_same_pid(self):
+        """測試重設後的前綴帶有隨機部分，行程 ID 相同時仍不重複"""
+        before = next_relationship_id()
+        _reset_relationship_ids()
+        after = next_relationship_id()
+
+        assert before.rsplit("-", 1)[0] != after.rsplit("-", 1)[0]
+
     def test_relationship_is_active(self):
         """測試關係有效性檢查"""
         relationship = CallsRelationship(source_id="func_001", target_id="func_002")
@@ -146,6 +214,7 @@ class TestCallsRelationship:
         future_time = datetime.now().replace(year=2030)
         relationship.valid_from = future_time
         assert relationship.is_active is False
+        assert relationship.is_active_at(future_time) is True
 
 
 @pytest.mark.unit
@@ -203,6 +272,56 @@ class TestConstraint:
         assert constraint.violation_count == initial_count + 1
         assert constraint.last_violation != initial_time
         assert constraint.last_violation is not None
+        assert constraint.updated_at == constraint.last_violation
+
+    def test_constraint_expiry_must_follow_creation(self):
+        """測試過期時間必須晚於創建時間"""
+        created_at = datetime(2024, 1, 1)
+
+        with pytest.raises(ValidationError):
+            Constraint(
+                name="Test Constraint",
+                constraint_type=ConstraintType.VERSION_PINNING,
+                description="Test constraint",
+                created_at=created_at,
+                expires_at=created_at,
+            )
+
+
+@pytest.mark.unit
+class TestLock:
+    """測試鎖定模型"""
+
+    def _make_lock(self, **kwargs) -> Lock:
+        """建立測試用鎖定"""
+        return Lock(
+            target_entity_id="func_001",
+            target_entity_type="Function",
+            holder_id="agent-1",
+            holder_type="agent",
+            reason="refactor",
+            **kwargs,
+        )
+
+    def test_lock_extend(self):
+        """測試延長鎖定時間"""
+        lock = self._make_lock()
+
+        lock.extend(5)
+        first_expiry = lock.expires_at
+        assert first_expiry is not None
+        assert first_expiry > lock.acquired_at
+
+        lock.extend(10)
+        assert lock.expires_at == first_expiry + timedelta(minutes=10)
+
+    def test_released_lock_cannot_extend(self):
+        """測試已釋放的鎖定不能延長"""
+        lock = self._make_lock()
+        lock.release()
+
+        with pytest.raises(ValueError):
+            lock.extend(5)
 
 
 @pytest.mark.unit
@@ -244,3 +363,104 @@ class TestModelSerialization:
         # source_id 和 target_id 不應該在屬性中
         assert "source_id" not in properties
         assert "target_id" not in properties
+
+    def test_relationship_graph_properties_follow_updates(self):
+        """測試關係屬性反映欄位更新"""
+        relationship = CallsRelationship(source_id="func_001", target_id="func_002")
+        assert relationship.to_graph_properties()["call_type"] == "direct"
+
+        relationship.call_type = "recursive"
+        relationship.extra["weight"] = 2
+        properties = relationship.to_graph_properties()
+        assert properties["call_type"] == "recursive"
+        assert properties["weight"] == 2
+
+        for deep in (False, True):
+            copied = relationship.model_copy(
+                update={"call_type": "indirect"}, deep=deep
+            )
+            assert isinstance(copied, CallsRelationship)
+            assert copied.to_graph_properties()["call_type"] == "indirect"
+
+    def test_relationship_graph_properties_follow_list_mutation(self):
+        """測試原地修改列表欄位後屬性隨之更新"""
+        relationship = ImportsRelationship(
+            source_id="file_001", target_id="mod_001", import_type="from"
+        )
+        assert relationship.to_graph_properties()["imported_items"] == []
+
+        relationship.imported_items.append("x")
+
+        assert relationship.to_graph_properties()["imported_items"] == ["x"]
+
+    def test_relationship_graph_properties_are_independent_copies(self):
+        """測試修改返回的屬性字典不影響關係本身與後續呼叫"""
+        relationship = ImportsRelationship(
+            source_id="file_001", target_id="mod_001", import_type="from"
+        )
+
+        properties = relationship.to_graph_properties()
+        properties["imported_items"].append("leak")
+        properties["import_type"] = "changed"
+
+        assert relationship.imported_items == []
+        assert relationship.to_graph_properties()["imported_items"] == []
+        assert relationship.to_graph_properties()["import_type"] == "from"
+
+    def test_atlassian_entity_to_graph_properties(self):
+        """測試 Atlassian 實體轉換為圖屬性"""
+        entity = AtlassianEntity(
+            id="PROJ-1",
+            entity_type="jira_issue",
+            properties={"status": "Open", "assignee": None},
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+
+        properties = entity.to_graph_properties()
+
+        assert properties == {
+            "id": "PROJ-1",
+            "entity_type": "jira_issue",
+            "created_at": "2024-01-02T03:04:05",
+            "status": "Open",
+        }
+
+
+@pytest.mark.unit
+class TestToolArgs:
+    """測試 MCP 工具參數模型"""
+
+    def test_search_code_args_valid(self):
+        """測試有效的搜尋參數"""
+        args = SearchCodeArgs(query="auth", limit=5)
+
+        assert args.query == "auth"
+        assert args.limit == 5
+
+    @pytest.mark.parametrize(
+        "query,limit", [("", 10), ("   ", 10), ("x" * 1001, 10), ("auth", 0)]
+    )
+    def test_search_code_args_invalid(self, query, limit):
+        """測試無效的搜尋參數"""
+        with pytest.raises(ValidationError):
+            SearchCodeArgs(query=query, limit=limit)
+
+    def test_analyze_impact_args_requires_project_id(self):
+        """測試影響分析需要專案 ID"""
+        assert AnalyzeImpactArgs(project_id="backend").pr_number == ""
+
+        with pytest.raises(ValidationError):
+            AnalyzeImpactArgs(project_id=" ")
+
+
+@pytest.mark.unit
+class TestResponseModels:
+    """測試 API 響應模型"""
+
+    def test_response_is_frozen(self):
+        """測試響應模型建立後不可修改"""
+        response = HealthResponse(status="healthy")
+
+        assert response.status == "healthy"
+        with pytest.raises(ValidationError):
+            response.status = "unhealthy"